@@ -1,30 +1,66 @@
 """SVG text element auto-generation module."""
 
+import ctypes
+import ctypes.util
+import json
+import math
+import os
+import string
 import subprocess
+import weakref
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Iterable, Literal
+from xml.parsers import expat
+from xml.sax.saxutils import escape, quoteattr
 
 # Layout direction type
 LayoutDirection = Literal["horizontal", "vertical"]
 
 # Alignment type for text positioning
 AlignType = Literal["bbox_center", "baseline_center"]
-from xml.etree import ElementTree as ET
 
 import freetype
-import yaml
 
-from .relabel import format_index, FormatType
-from .utils import register_namespaces, SVG_NAMESPACES
+from .relabel import format_index, to_letter, FormatType
+from .utils import (
+    ET,
+    INKSCAPE_LABEL,
+    SVG_G_TAG,
+    SVG_NAMESPACES,
+    USING_LXML,
+    load_svg,
+    load_yaml,
+)
 
 
 # Measurement size for accurate font metrics (larger = more accurate)
 MEASURE_FONT_SIZE_PT = 100
 
+# MEASURE_FONT_SIZE_PT points at 96 DPI, in px. A target size in mm scales
+# measured px to mm by font_size_mm / _MEASURE_SIZE_PX (the mm<->px factors
+# of 96/25.4 cancel out).
+_MEASURE_SIZE_PX = MEASURE_FONT_SIZE_PT * 96 / 72
 
-@dataclass
+# Qualified names for created elements and attributes
+_G_TAG = SVG_G_TAG
+_TEXT_TAG = f"{{{SVG_NAMESPACES['svg']}}}text"
+_LABEL_ATTR = INKSCAPE_LABEL
+
+# Formatter for text x/y attributes. Coordinates are in mm, so 3 decimals
+# (1 um) is far below anything visible in rendered or printed output.
+_format_3f = "{:.3f}".format
+
+
+def _format_coord(value: float) -> str:
+    """Format a coordinate with 3 decimals and trailing zeros trimmed."""
+    text = _format_3f(value).rstrip("0").rstrip(".")
+    # Values that round to zero come out as "-0" or "" after trimming
+    return text if text not in ("-0", "") else "0"
+
+
+@dataclass(slots=True)
 class FontConfig:
     """Font configuration for text elements."""
 
@@ -33,7 +69,7 @@ class FontConfig:
     color: str = "#000000"
 
 
-@dataclass
+@dataclass(slots=True)
 class TextFormatConfig:
     """Text label format configuration."""
 
@@ -58,6 +94,7 @@ class TextLineRule:
     font: FontConfig = field(default_factory=FontConfig)
     format: TextFormatConfig = field(default_factory=TextFormatConfig)
     align: AlignType = "bbox_center"  # Text alignment mode
+    uniform_width: bool = False  # Reuse one measured offset per label length
 
     # Horizontal layout (y fixed, x varies)
     y: float | None = None  # Fixed Y coordinate (mm)
@@ -117,7 +154,7 @@ class AddTextRule:
     groups: list[TextLineRule] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TextElementInfo:
     """Information about a created text element."""
 
@@ -129,7 +166,7 @@ class TextElementInfo:
     text_y: float  # Actual text Y (mm) - adjusted for centering
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupAddResult:
     """Result of adding text elements to a group.
 
@@ -183,7 +220,7 @@ class AddTextReport:
         return sum(g.element_count for g in self.group_results)
 
 
-@dataclass
+@dataclass(slots=True)
 class TextExtents:
     """Text bounding box extents."""
 
@@ -194,9 +231,192 @@ class TextExtents:
     x_advance: float  # Advance width for next character
 
 
+# Shared library names to try for libfontconfig
+_FONTCONFIG_LIBS = ("libfontconfig.so.1", "libfontconfig.1.dylib", "libfontconfig-1.dll")
+
+
+@lru_cache(maxsize=None)
+def _load_fontconfig() -> ctypes.CDLL | None:
+    """Load libfontconfig and declare the functions used for matching.
+
+    Returns:
+        Loaded library, or None if libfontconfig is not available.
+    """
+    names = [ctypes.util.find_library("fontconfig"), *_FONTCONFIG_LIBS]
+    for name in names:
+        if not name:
+            continue
+        try:
+            lib = ctypes.CDLL(name)
+        except OSError:
+            continue
+
+        lib.FcNameParse.restype = ctypes.c_void_p
+        lib.FcNameParse.argtypes = [ctypes.c_char_p]
+        lib.FcConfigSubstitute.restype = ctypes.c_int
+        lib.FcConfigSubstitute.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
+        lib.FcDefaultSubstitute.restype = None
+        lib.FcDefaultSubstitute.argtypes = [ctypes.c_void_p]
+        lib.FcFontMatch.restype = ctypes.c_void_p
+        lib.FcFontMatch.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_int),
+        ]
+        lib.FcPatternGetString.restype = ctypes.c_int
+        lib.FcPatternGetString.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_char_p,
+            ctypes.c_int,
+            ctypes.POINTER(ctypes.c_char_p),
+        ]
+        lib.FcPatternDestroy.restype = None
+        lib.FcPatternDestroy.argtypes = [ctypes.c_void_p]
+        return lib
+    return None
+
+
+def _fc_lookup(
+    lib: ctypes.CDLL, font_family: str
+) -> tuple[str, tuple[str, ...]] | None:
+    """Match a font family in-process with libfontconfig (like fc-match).
+
+    Args:
+        lib: Loaded libfontconfig.
+        font_family: Font family name (fontconfig pattern syntax).
+
+    Returns:
+        Tuple of (font file path, family names of the matched font), or
+        None if no match.
+    """
+    pattern = lib.FcNameParse(font_family.encode("utf-8"))
+    if not pattern:
+        return None
+    try:
+        # FcMatchPattern = 0; a NULL config means the current default config
+        lib.FcConfigSubstitute(None, pattern, 0)
+        lib.FcDefaultSubstitute(pattern)
+        result = ctypes.c_int()
+        match = lib.FcFontMatch(None, pattern, ctypes.byref(result))
+        if not match:
+            return None
+        try:
+            value = ctypes.c_char_p()
+            # FcResultMatch = 0
+            if lib.FcPatternGetString(match, b"file", 0, ctypes.byref(value)) != 0:
+                return None
+            if not value.value:
+                return None
+            file_path = value.value.decode("utf-8")
+
+            # A font can list several family names (e.g. localized ones)
+            families = []
+            while (
+                lib.FcPatternGetString(
+                    match, b"family", len(families), ctypes.byref(value)
+                )
+                == 0
+                and value.value
+            ):
+                families.append(value.value.decode("utf-8"))
+            return file_path, tuple(families)
+        finally:
+            lib.FcPatternDestroy(match)
+    finally:
+        lib.FcPatternDestroy(pattern)
+
+
+# Font directories and config whose modification invalidates the disk cache
+_FONT_DIRS = (
+    "/etc/fonts",
+    "/etc/fonts/conf.d",
+    "~/.config/fontconfig",
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    "~/.fonts",
+    "~/.local/share/fonts",
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    "~/Library/Fonts",
+    "C:/Windows/Fonts",
+)
+
+
+def _font_cache_file() -> Path:
+    """Return the path of the persistent font lookup cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "svg_tools" / "font_paths.json"
+
+
+def _font_dirs_stamp() -> dict[str, int]:
+    """Return modification times of the existing font directories."""
+    stamp = {}
+    for font_dir in _FONT_DIRS:
+        try:
+            stamp[font_dir] = os.stat(os.path.expanduser(font_dir)).st_mtime_ns
+        except OSError:
+            continue
+    return stamp
+
+
+# Format version of the persistent font cache; older files are discarded
+_FONT_CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=None)
+def _disk_font_cache() -> dict[str, str]:
+    """Load the persistent family -> font path cache (once per process).
+
+    Returns:
+        Cached mapping, or an empty dict if the cache is missing, unreadable,
+        from another format version, or was written before the font
+        directories last changed.
+    """
+    try:
+        data = json.loads(_font_cache_file().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != _FONT_CACHE_VERSION
+        or data.get("stamp") != _font_dirs_stamp()
+    ):
+        return {}
+    paths = data.get("paths")
+    return dict(paths) if isinstance(paths, dict) else {}
+
+
+def _save_disk_font_cache(paths: dict[str, str]) -> None:
+    """Write the persistent font cache, ignoring I/O errors."""
+    cache_file = _font_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(
+            json.dumps(
+                {
+                    "version": _FONT_CACHE_VERSION,
+                    "stamp": _font_dirs_stamp(),
+                    "paths": paths,
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
 @lru_cache(maxsize=32)
 def find_font_file(font_family: str) -> str | None:
-    """Find font file path using fc-match.
+    """Find font file path with fontconfig.
+
+    Exact family matches are also kept in a JSON cache under the user
+    cache directory so later runs skip the fontconfig match. Fallback
+    substitutes (another family returned for a missing font) are not
+    persisted, so installing the requested font later takes effect. The
+    cache is discarded when any font directory changes, and entries whose
+    file no longer exists are looked up again.
 
     Args:
         font_family: Font family name.
@@ -204,33 +424,143 @@ def find_font_file(font_family: str) -> str | None:
     Returns:
         Path to font file or None if not found.
     """
+    cache = _disk_font_cache()
+    path = cache.get(font_family)
+    if path is not None and os.path.exists(path):
+        return path
+
+    matched = _match_font_file(font_family)
+    if matched is None:
+        return None
+    path, families = matched
+    if _is_exact_family_match(font_family, families):
+        cache[font_family] = path
+        _save_disk_font_cache(cache)
+    return path
+
+
+def _is_exact_family_match(font_family: str, families: Iterable[str]) -> bool:
+    """Check whether a fontconfig match is the requested family itself.
+
+    Args:
+        font_family: Requested family (fontconfig pattern; properties after
+            ':' are ignored).
+        families: Family names of the matched font.
+
+    Returns:
+        True if the requested family is one of the matched font's names.
+    """
+    requested = font_family.split(":", 1)[0].strip().casefold()
+    return any(family.casefold() == requested for family in families)
+
+
+def _match_font_file(font_family: str) -> tuple[str, tuple[str, ...]] | None:
+    """Match a font family with fontconfig (library or fc-match command).
+
+    Args:
+        font_family: Font family name.
+
+    Returns:
+        Tuple of (font file path, family names of the matched font), or
+        None if not found.
+    """
+    lib = _load_fontconfig()
+    if lib is not None:
+        return _fc_lookup(lib, font_family)
+
     try:
         result = subprocess.run(
-            ["fc-match", font_family, "-f", "%{file}"],
+            ["fc-match", font_family, "-f", "%{file}\\n%{family}"],
             capture_output=True,
             text=True,
             timeout=5,
         )
         if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
+            file_path, _, families = result.stdout.strip().partition("\n")
+            return file_path, tuple(
+                family.strip() for family in families.split(",") if family.strip()
+            )
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
     return None
 
 
-@lru_cache(maxsize=8)
+# Glyph metrics: (bearing_x, bearing_y, width, height, advance) in pixels
+_GlyphMetrics = tuple[float, float, float, float, float]
+
+# Per-face glyph metrics, keyed by (char size, dpi) and then by character
+_glyph_metrics_cache: weakref.WeakKeyDictionary[
+    freetype.Face, dict[tuple[int, int], dict[str, _GlyphMetrics]]
+] = weakref.WeakKeyDictionary()
+
+# Character size (char size, dpi) each face was last configured with, so
+# measuring at an unchanged size skips set_char_size()
+_face_char_sizes: weakref.WeakKeyDictionary[freetype.Face, tuple[int, int]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def load_font_face(font_path: str) -> freetype.Face:
     """Load a FreeType font face.
 
+    Faces are cached by path, modification time and size, so a font file
+    replaced on disk is loaded again instead of serving the stale face.
+
     Args:
         font_path: Path to font file.
 
     Returns:
         FreeType Face object.
     """
+    st = os.stat(font_path)
+    return _load_font_face_at(font_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=64)
+def _load_font_face_at(font_path: str, mtime_ns: int, size: int) -> freetype.Face:
+    """Cached implementation of load_font_face() for one file version."""
+    # FreeType maps the file itself (FT_Stream_Open), so the path is passed
+    # through rather than reading the font into Python memory
     return freetype.Face(font_path)
 
 
+def _load_glyph_metrics(
+    face: freetype.Face,
+    glyphs: dict[str, _GlyphMetrics],
+    chars: Iterable[str],
+    char_size: int,
+    dpi: int,
+) -> None:
+    """Load metrics for characters missing from a face's glyph table.
+
+    Args:
+        face: FreeType face object.
+        glyphs: Glyph table for (char_size, dpi), updated in place.
+        chars: Characters to load.
+        char_size: Character size in 1/64th of points.
+        dpi: DPI for rendering.
+    """
+    for char in chars:
+        if char in glyphs:
+            continue
+        if _face_char_sizes.get(face) != (char_size, dpi):
+            # Set font size (in 1/64th of points)
+            face.set_char_size(char_size, 0, dpi, dpi)
+            _face_char_sizes[face] = (char_size, dpi)
+        # Measurement only: read outline metrics without rasterizing
+        # or hinting the glyph
+        face.load_char(char, freetype.FT_LOAD_NO_BITMAP | freetype.FT_LOAD_NO_HINTING)
+        m = face.glyph.metrics
+        # Glyph metrics are 26.6 fixed point
+        glyphs[char] = (
+            m.horiBearingX / 64,
+            m.horiBearingY / 64,
+            m.width / 64,
+            m.height / 64,
+            m.horiAdvance / 64,
+        )
+
+
 def get_text_extents_freetype(
     face: freetype.Face,
     text: str,
@@ -239,6 +569,9 @@ def get_text_extents_freetype(
 ) -> TextExtents:
     """Get text bounding box using FreeType.
 
+    Glyph metrics and the face's configured character size are cached per
+    face, so callers should not resize the face themselves between calls.
+
     Args:
         face: FreeType face object.
         text: Text to measure.
@@ -248,8 +581,12 @@ def get_text_extents_freetype(
     Returns:
         TextExtents with measurements in font units (relative to font_size_pt).
     """
-    # Set font size (in 1/64th of points)
-    face.set_char_size(int(font_size_pt * 64), 0, dpi, dpi)
+    # Per-glyph metrics for this face and size; glyphs are only loaded from
+    # FreeType the first time a character is seen
+    char_size = int(font_size_pt * 64)
+    glyphs: dict[str, _GlyphMetrics] = _glyph_metrics_cache.setdefault(
+        face, {}
+    ).setdefault((char_size, dpi), {})
 
     pen_x = 0
     min_x = float("inf")
@@ -258,13 +595,13 @@ def get_text_extents_freetype(
     max_y = float("-inf")
 
     for char in text:
-        face.load_char(char, freetype.FT_LOAD_RENDER)
-        glyph = face.glyph
+        metrics = glyphs.get(char)
+        if metrics is None:
+            _load_glyph_metrics(face, glyphs, char, char_size, dpi)
+            metrics = glyphs[char]
 
-        left = pen_x + glyph.bitmap_left
-        top = glyph.bitmap_top
-        width = glyph.bitmap.width
-        height = glyph.bitmap.rows
+        bearing_x, top, width, height, advance = metrics
+        left = pen_x + bearing_x
 
         if width > 0 and height > 0:
             min_x = min(min_x, left)
@@ -272,7 +609,7 @@ def get_text_extents_freetype(
             min_y = min(min_y, -top)
             max_y = max(max_y, -top + height)
 
-        pen_x += glyph.advance.x >> 6
+        pen_x += advance
 
     if min_x == float("inf"):
         # Empty or whitespace text
@@ -305,25 +642,75 @@ def calculate_text_offset_freetype(
         Tuple of (offset_x, offset_y) in mm.
         Add these to grid center to get text x,y attributes.
     """
+    # Round the size so float noise from rule arithmetic does not defeat the cache
+    return _offset_cached(get_face(font_family), round(font_size_mm, 6), text, align)
+
+
+@lru_cache(maxsize=4096)
+def _offset_cached(
+    face: freetype.Face | None,
+    font_size_mm: float,
+    text: str,
+    align: AlignType,
+) -> tuple[float, float]:
+    """Cached implementation of calculate_text_offset_freetype().
+
+    Keyed by face rather than family, so a reloaded font file is measured
+    again instead of serving offsets from the stale face.
+    """
+    return _offset_from_face(face, font_size_mm, text, align)
+
+
+def get_face(font_family: str) -> freetype.Face | None:
+    """Find and load the FreeType face for a font family.
+
+    The family -> path lookup is cached by find_font_file(), and the face
+    by load_font_face(), which checks the file's modification time and
+    size on every call. A font file replaced on disk therefore yields a
+    new face.
+
+    Args:
+        font_family: Font family name.
+
+    Returns:
+        FreeType Face, or None if the font cannot be found or loaded.
+    """
     font_path = find_font_file(font_family)
     if font_path is None:
-        # Fallback to estimation if font not found
-        return calculate_text_offset_estimated(font_size_mm, text, align)
+        return None
 
     try:
-        face = load_font_face(font_path)
+        return load_font_face(font_path)
     except Exception:
+        return None
+
+
+def _offset_from_face(
+    face: freetype.Face | None,
+    font_size_mm: float,
+    text: str,
+    align: AlignType,
+) -> tuple[float, float]:
+    """Calculate a text offset from an already resolved face.
+
+    Args:
+        face: FreeType face, or None to fall back to estimation.
+        font_size_mm: Font size in mm.
+        text: Text content.
+        align: Alignment mode - "bbox_center" or "baseline_center".
+
+    Returns:
+        Tuple of (offset_x, offset_y) in mm.
+    """
+    if face is None:
+        # Fallback to estimation if font not found
         return calculate_text_offset_estimated(font_size_mm, text, align)
 
     # Measure at large size for accuracy
     extents = get_text_extents_freetype(face, text, MEASURE_FONT_SIZE_PT)
 
-    # Scale from measurement size to target size
-    # MEASURE_FONT_SIZE_PT points at 96 DPI = MEASURE_FONT_SIZE_PT * 96/72 px
-    measure_size_px = MEASURE_FONT_SIZE_PT * 96 / 72
-    # Convert target font size from mm to px at 96 DPI
-    font_size_px = font_size_mm * 96 / 25.4
-    scale = font_size_px / measure_size_px
+    # Scale from measurement px straight to target mm
+    scale = font_size_mm / _MEASURE_SIZE_PX
 
     # Calculate offset for centering
     # Text origin (x,y) is at baseline left
@@ -331,23 +718,47 @@ def calculate_text_offset_freetype(
     #   grid_x = text_x + x_bearing + width/2
     #   text_x = grid_x - x_bearing - width/2
     #   offset_x = text_x - grid_x = -(x_bearing + width/2)
-    offset_x_px = -(extents.x_bearing + extents.width / 2) * scale
+    offset_x_mm = -(extents.x_bearing + extents.width / 2) * scale
 
     # Y direction: depends on alignment mode
     if align == "baseline_center":
         # Place baseline at grid Y coordinate
-        offset_y_px = 0
+        offset_y_mm = 0.0
     else:  # bbox_center
         # Center bbox vertically at grid point
-        offset_y_px = -(extents.y_bearing + extents.height / 2) * scale
-
-    # Convert px to mm
-    offset_x_mm = offset_x_px * 25.4 / 96
-    offset_y_mm = offset_y_px * 25.4 / 96
+        offset_y_mm = -(extents.y_bearing + extents.height / 2) * scale
 
     return (offset_x_mm, offset_y_mm)
 
 
+def calculate_text_offsets(
+    font_family: str,
+    font_size_mm: float,
+    texts: Iterable[str],
+    align: AlignType = "bbox_center",
+) -> dict[str, tuple[float, float]]:
+    """Calculate offsets for a batch of texts sharing one font.
+
+    The font face is resolved once for the whole batch and each distinct
+    text is measured once.
+
+    Args:
+        font_family: Font family name.
+        font_size_mm: Font size in mm.
+        texts: Text contents (duplicates allowed).
+        align: Alignment mode - "bbox_center" or "baseline_center".
+
+    Returns:
+        Mapping of text to (offset_x, offset_y) in mm.
+    """
+    face = get_face(font_family)
+    size = round(font_size_mm, 6)
+    return {
+        text: _offset_from_face(face, size, text, align)
+        for text in dict.fromkeys(texts)
+    }
+
+
 def calculate_text_offset_estimated(
     font_size_mm: float,
     text: str,
@@ -382,6 +793,24 @@ def calculate_text_offset_estimated(
     return (offset_x, offset_y)
 
 
+@lru_cache(maxsize=32)
+def _font_style(family: str, size: float, color: str) -> str:
+    """Build the style attribute value for a font (cached per font).
+
+    Args:
+        family: Font family name.
+        size: Font size in mm.
+        color: Fill color.
+
+    Returns:
+        CSS style string.
+    """
+    # In SVG with mm-based viewBox (e.g., "0 0 210 297" with width="210mm"),
+    # 1 viewBox unit = 1 mm. Font-size is specified in viewBox units (unitless)
+    # so font.size (in mm) directly gives the correct size.
+    return f"font-family:{family};font-size:{size};fill:{color}"
+
+
 def create_text_element(
     grid_x_mm: float,
     grid_y_mm: float,
@@ -389,6 +818,7 @@ def create_text_element(
     font: FontConfig,
     element_id: str,
     align: AlignType = "bbox_center",
+    offset: tuple[float, float] | None = None,
 ) -> tuple[ET.Element, TextElementInfo]:
     """Create a text element positioned at grid position.
 
@@ -401,35 +831,57 @@ def create_text_element(
         font: Font configuration (size in mm).
         element_id: ID for the element.
         align: Alignment mode - "bbox_center" or "baseline_center".
+        offset: Precomputed (offset_x, offset_y) in mm. If None, it is
+            calculated from the font metrics.
 
     Returns:
         Tuple of (ET.Element, TextElementInfo).
     """
     # Calculate offset using FreeType
-    offset_x_mm, offset_y_mm = calculate_text_offset_freetype(
-        font.family, font.size, text, align
-    )
+    if offset is None:
+        offset = calculate_text_offset_freetype(font.family, font.size, text, align)
 
-    # Calculate final text position in mm
-    text_x_mm = grid_x_mm + offset_x_mm
-    text_y_mm = grid_y_mm + offset_y_mm
-
-    # Create text element
-    svg_ns = SVG_NAMESPACES["svg"]
-    elem = ET.Element(f"{{{svg_ns}}}text")
-    elem.set("id", element_id)
-    elem.set("x", f"{text_x_mm:.6f}")
-    elem.set("y", f"{text_y_mm:.6f}")
-    # In SVG with mm-based viewBox (e.g., "0 0 210 297" with width="210mm"),
-    # 1 viewBox unit = 1 mm. Font-size is specified in viewBox units (unitless)
-    # so font.size (in mm) directly gives the correct size.
-    elem.set(
-        "style",
-        f"font-family:{font.family};font-size:{font.size};fill:{font.color}",
+    attrs, info = _text_element_attrs(
+        grid_x_mm, grid_y_mm, text, font, element_id, offset
     )
+    elem = ET.Element(_TEXT_TAG, attrs)
     elem.text = text
 
-    # Create info
+    return elem, info
+
+
+def _text_element_attrs(
+    grid_x_mm: float,
+    grid_y_mm: float,
+    text: str,
+    font: FontConfig,
+    element_id: str,
+    offset: tuple[float, float],
+) -> tuple[dict[str, str], TextElementInfo]:
+    """Build text element attributes and info without creating the element.
+
+    Args:
+        grid_x_mm: Grid center X coordinate in mm.
+        grid_y_mm: Grid center Y coordinate in mm.
+        text: Text content.
+        font: Font configuration (size in mm).
+        element_id: ID for the element.
+        offset: (offset_x, offset_y) in mm from grid center to text origin.
+
+    Returns:
+        Tuple of (attribute mapping, TextElementInfo).
+    """
+    # Calculate final text position in mm
+    text_x_mm = grid_x_mm + offset[0]
+    text_y_mm = grid_y_mm + offset[1]
+
+    attrs = {
+        "id": element_id,
+        "x": _format_coord(text_x_mm),
+        "y": _format_coord(text_y_mm),
+        "style": _font_style(font.family, font.size, font.color),
+    }
+
     info = TextElementInfo(
         element_id=element_id,
         text=text,
@@ -439,7 +891,7 @@ def create_text_element(
         text_y=text_y_mm,
     )
 
-    return elem, info
+    return attrs, info
 
 
 def generate_grid_positions(
@@ -458,15 +910,32 @@ def generate_grid_positions(
     if x_interval <= 0:
         return [x_start]
 
-    positions = []
-    x = x_start
-    # Use a small tolerance for floating point comparison
-    tolerance = x_interval * 0.001
-    while x <= x_end + tolerance:
-        positions.append(x)
-        x += x_interval
+    # Compute the step count up front (with a small tolerance for floating
+    # point comparison) and derive each position from its index, so rounding
+    # error does not accumulate over long runs.
+    count = math.floor((x_end - x_start) / x_interval + 0.001) + 1
+    return [x_start + i * x_interval for i in range(count)]
 
-    return positions
+
+@lru_cache(maxsize=4096)
+def _cached_label(
+    index: int,
+    format_type: FormatType,
+    padding: int,
+    custom: tuple[str, ...],
+) -> str:
+    """Format an index with hashable arguments (cached across groups).
+
+    Args:
+        index: 1-based index.
+        format_type: Format type.
+        padding: Zero-padding width for numbers.
+        custom: Custom labels (empty tuple if unused).
+
+    Returns:
+        Formatted label string.
+    """
+    return format_index(index, format_type, padding, list(custom) if custom else None)
 
 
 def generate_text_label(
@@ -482,42 +951,57 @@ def generate_text_label(
     Returns:
         Formatted label string.
     """
-    return format_index(
-        index,
-        fmt.type,
-        fmt.padding,
-        fmt.custom if fmt.custom else None,
-    )
+    return _cached_label(index, fmt.type, fmt.padding, tuple(fmt.custom))
 
 
-def create_text_group(
-    rule: TextLineRule,
-    id_prefix: str = "text",
-    indent: str = "  ",
-    base_indent: int = 0,
-) -> tuple[ET.Element, GroupAddResult]:
-    """Create a group with text elements according to rule.
+def generate_text_labels(fmt: TextFormatConfig, count: int) -> list[str | None]:
+    """Generate labels for count consecutive indices starting at fmt.start.
 
-    Supports both horizontal (y fixed, x varies) and vertical (x fixed, y varies)
-    layouts.
+    Equivalent to calling generate_text_label() for each index, but
+    specialized per format type so the whole run is produced in one pass.
 
     Args:
-        rule: Text line rule.
-        id_prefix: Prefix for element IDs.
-        indent: Indentation string (default: 2 spaces).
-        base_indent: Base indentation level for the group.
+        fmt: Format configuration.
+        count: Number of labels to generate.
 
     Returns:
-        Tuple of (group_element, GroupAddResult).
+        List of labels; None where generate_text_label() would raise
+        (custom index out of range or mapped to the skip marker, or a
+        letter index below 1).
     """
-    svg_ns = SVG_NAMESPACES["svg"]
-    inkscape_ns = SVG_NAMESPACES["inkscape"]
+    indices = range(fmt.start, fmt.start + count)
+    if fmt.type == "number":
+        if fmt.padding > 0:
+            padding = fmt.padding
+            return [str(index).zfill(padding) for index in indices]
+        return list(map(str, indices))
+    if fmt.type in ("letter", "letter_upper"):
+        upper = fmt.type == "letter_upper"
+        return [to_letter(index, upper) if index >= 1 else None for index in indices]
+    if fmt.type == "custom" and fmt.custom:
+        custom = fmt.custom
+        n = len(custom)
+        return [
+            label if 1 <= index <= n and (label := custom[index - 1]) != "_" else None
+            for index in indices
+        ]
+    return [None] * count
+
+
+def _layout_text_group(
+    rule: TextLineRule,
+    id_prefix: str,
+) -> tuple[list[tuple[str, str, str, str]], str, GroupAddResult]:
+    """Compute text element attributes for a group without building XML.
 
-    # Create group element
-    group = ET.Element(f"{{{svg_ns}}}g")
-    group.set("id", rule.name)
-    group.set(f"{{{inkscape_ns}}}label", rule.name)
+    Args:
+        rule: Text line rule.
+        id_prefix: Prefix for element IDs.
 
+    Returns:
+        Tuple of (rows, style, GroupAddResult). Each row is
+        (element_id, x, y, label) with coordinates already formatted.
+    """
     # Initialize result with axis-agnostic structure
     result = GroupAddResult(
         group_name=rule.name,
@@ -531,57 +1015,241 @@ def create_text_group(
     # Generate grid positions on the varying axis
     positions = generate_grid_positions(rule.start_coord, rule.end_coord, rule.interval)
 
-    # Indentation for child elements
-    child_indent = indent * (base_indent + 1)
-    group_indent = indent * base_indent
-
-    # Create text elements
-    elements_created = []
-    for i, pos in enumerate(positions):
-        index = rule.format.start + i
+    # Generate labels first, keeping the position index of each
+    labels: list[tuple[int, float, str]] = []
+    for i, (pos, label) in enumerate(
+        zip(positions, generate_text_labels(rule.format, len(positions)))
+    ):
+        if label is None:
+            # Rare path: ask the single-label generator for the error message
+            index = rule.format.start + i
+            try:
+                label = generate_text_label(index, rule.format)
+            except ValueError as e:
+                result.errors.append(f"Failed to generate label at index {index}: {e}")
+                continue
+
+        labels.append((i, pos, label))
+
+    # Offsets depend only on the label text for a given font and alignment,
+    # so measure each distinct label once. The fixed-axis coordinate then
+    # also depends only on the label, so format it once per label too.
+    if rule.uniform_width:
+        # Opt-in for fonts whose digits/letters share one advance width:
+        # measure the first label of each length and reuse its offset.
+        representatives: dict[int, str] = {}
+        for _, _, label in labels:
+            representatives.setdefault(len(label), label)
+        measured = calculate_text_offsets(
+            rule.font.family,
+            rule.font.size,
+            representatives.values(),
+            rule.align,
+        )
+        offsets = {
+            label: measured[representatives[len(label)]] for _, _, label in labels
+        }
+    else:
+        offsets = calculate_text_offsets(
+            rule.font.family,
+            rule.font.size,
+            (label for _, _, label in labels),
+            rule.align,
+        )
+    fixed_axis = 0 if rule.is_vertical else 1
+    fixed_strs = {
+        label: _format_coord(rule.fixed_coord + offset[fixed_axis])
+        for label, offset in offsets.items()
+    }
 
-        try:
-            label = generate_text_label(index, rule.format)
-        except ValueError as e:
-            result.errors.append(f"Failed to generate label at index {index}: {e}")
-            continue
+    # Shared by every element in the group
+    style = _font_style(rule.font.family, rule.font.size, rule.font.color)
 
+    rows: list[tuple[str, str, str, str]] = []
+    for i, pos, label in labels:
         element_id = f"{id_prefix}-{i + 1}"
+        offset_x, offset_y = offsets[label]
 
         # Determine coordinates based on layout direction
         if rule.is_vertical:
             grid_x = rule.fixed_coord  # x is fixed
             grid_y = pos  # y varies
+            x_str = fixed_strs[label]
+            y_str = _format_coord(grid_y + offset_y)
         else:
             grid_x = pos  # x varies
             grid_y = rule.fixed_coord  # y is fixed
+            x_str = _format_coord(grid_x + offset_x)
+            y_str = fixed_strs[label]
+
+        rows.append((element_id, x_str, y_str, label))
+        result.elements.append(
+            TextElementInfo(
+                element_id=element_id,
+                text=label,
+                grid_x=grid_x,
+                grid_y=grid_y,
+                text_x=grid_x + offset_x,
+                text_y=grid_y + offset_y,
+            )
+        )
+
+    return rows, style, result
+
+
+def create_text_group(
+    rule: TextLineRule,
+    id_prefix: str = "text",
+    indent: str = "  ",
+    base_indent: int = 0,
+) -> tuple[ET.Element, GroupAddResult]:
+    """Create a group with text elements according to rule.
+
+    Supports both horizontal (y fixed, x varies) and vertical (x fixed, y varies)
+    layouts.
 
-        elem, info = create_text_element(
-            grid_x_mm=grid_x,
-            grid_y_mm=grid_y,
-            text=label,
-            font=rule.font,
-            element_id=element_id,
-            align=rule.align,
+    Args:
+        rule: Text line rule.
+        id_prefix: Prefix for element IDs.
+        indent: Indentation string (default: 2 spaces).
+        base_indent: Base indentation level for the group.
+
+    Returns:
+        Tuple of (group_element, GroupAddResult).
+    """
+    rows, style, result = _layout_text_group(rule, id_prefix)
+
+    # Create group element
+    group = ET.Element(_G_TAG, {"id": rule.name, _LABEL_ATTR: rule.name})
+
+    # Indentation for child elements
+    child_tail = "\n" + indent * (base_indent + 1)
+    group_indent = indent * base_indent
+
+    # Create text elements directly under the group
+    elem = None
+    for element_id, x_str, y_str, label in rows:
+        elem = ET.SubElement(
+            group,
+            _TEXT_TAG,
+            {"id": element_id, "x": x_str, "y": y_str, "style": style},
         )
+        elem.text = label
+        elem.tail = child_tail
 
-        elements_created.append(elem)
-        result.elements.append(info)
-
-    # Add elements with proper formatting
-    if elements_created:
-        group.text = "\n" + child_indent
-        for i, elem in enumerate(elements_created):
-            group.append(elem)
-            if i < len(elements_created) - 1:
-                elem.tail = "\n" + child_indent
-            else:
-                elem.tail = "\n" + group_indent
+    # Indent children and close the group
+    if elem is not None:
+        group.text = child_tail
+        elem.tail = "\n" + group_indent
         group.tail = "\n"
 
     return group, result
 
 
+# Namespace declarations that make a serialized group self-contained
+_GROUP_NS_DECLS = (
+    f' xmlns="{SVG_NAMESPACES["svg"]}"'
+    f' xmlns:inkscape="{SVG_NAMESPACES["inkscape"]}"'
+)
+
+
+def build_text_group_xml(
+    rule: TextLineRule,
+    id_prefix: str = "text",
+    indent: str = "  ",
+    base_indent: int = 0,
+    declare_namespaces: bool = True,
+) -> tuple[bytes, GroupAddResult]:
+    """Serialize a text group directly to XML without building a DOM.
+
+    Produces the same group as create_text_group() (without the trailing
+    tail). By default the root <g> declares the svg and inkscape namespaces
+    so the fragment can be parsed on its own.
+
+    Args:
+        rule: Text line rule.
+        id_prefix: Prefix for element IDs.
+        indent: Indentation string (default: 2 spaces).
+        base_indent: Base indentation level for the group.
+        declare_namespaces: Whether to declare the namespaces on the <g>.
+            Disable only when the fragment is inserted into a document
+            whose root already declares them.
+
+    Returns:
+        Tuple of (UTF-8 encoded XML fragment, GroupAddResult).
+    """
+    rows, style, result = _layout_text_group(rule, id_prefix)
+
+    name = quoteattr(rule.name)
+    ns_decls = _GROUP_NS_DECLS if declare_namespaces else ""
+    head = f"<g{ns_decls} id={name} inkscape:label={name}>"
+    if not rows:
+        return (head[:-1] + " />").encode("utf-8"), result
+
+    child_sep = "\n" + indent * (base_indent + 1)
+    style_attr = quoteattr(style)
+    parts = [head]
+    parts.extend(
+        f"{child_sep}<text id={quoteattr(element_id)} x=\"{x_str}\" "
+        f"y=\"{y_str}\" style={style_attr}>{escape(label)}</text>"
+        for element_id, x_str, y_str, label in rows
+    )
+    parts.append(f"\n{indent * base_indent}</g>")
+    return "".join(parts).encode("utf-8"), result
+
+
+# Scalar fields of the optional font/format sections and their converters
+_FONT_FIELDS = {"family": str, "size": float, "color": str}
+_FORMAT_FIELDS = {"type": str, "padding": int, "start": int}
+
+
+def parse_font_config(data: dict | None) -> FontConfig:
+    """Build a FontConfig from a rule file's font section.
+
+    Args:
+        data: Font section dictionary, or None if omitted.
+
+    Returns:
+        FontConfig with defaults for missing fields.
+    """
+    if not data:
+        return FontConfig()
+    return FontConfig(
+        **{key: conv(data[key]) for key, conv in _FONT_FIELDS.items() if key in data}
+    )
+
+
+def parse_text_format_config(data: dict | None) -> TextFormatConfig:
+    """Build a TextFormatConfig from a rule file's format section.
+
+    Args:
+        data: Format section dictionary, or None if omitted.
+
+    Returns:
+        TextFormatConfig with defaults for missing fields.
+
+    Raises:
+        ValueError: If the type is unknown or custom labels are missing.
+    """
+    if not data:
+        return TextFormatConfig()
+    fmt = TextFormatConfig(
+        **{key: conv(data[key]) for key, conv in _FORMAT_FIELDS.items() if key in data}
+    )
+    if fmt.type not in ("number", "letter", "letter_upper", "custom"):
+        raise ValueError(f"Invalid format.type value: {fmt.type}")
+    if "custom" in data:
+        custom = data["custom"]
+        if not isinstance(custom, list):
+            raise ValueError("format.custom must be a list")
+        fmt.custom = [str(item) for item in custom]
+
+    # Validate custom type requires custom labels
+    if fmt.type == "custom" and not fmt.custom:
+        raise ValueError("format.custom is required when type is 'custom'")
+    return fmt
+
+
 def parse_add_text_rule_file(rule_path: Path) -> AddTextRule:
     """Parse a YAML add-text rule file.
 
@@ -596,8 +1264,7 @@ def parse_add_text_rule_file(rule_path: Path) -> AddTextRule:
         yaml.YAMLError: If the file is not valid YAML.
         ValueError: If the rule format is invalid.
     """
-    with open(rule_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = load_yaml(rule_path)
 
     if not isinstance(data, dict):
         raise ValueError("Rule file must be a YAML dictionary")
@@ -642,39 +1309,9 @@ def parse_add_text_rule_file(rule_path: Path) -> AddTextRule:
                         f"'{field}' field"
                     )
 
-        # Font (optional)
-        font = FontConfig()
-        if "font" in group_data:
-            font_data = group_data["font"]
-            if "family" in font_data:
-                font.family = str(font_data["family"])
-            if "size" in font_data:
-                font.size = float(font_data["size"])
-            if "color" in font_data:
-                font.color = str(font_data["color"])
-
-        # Format (optional)
-        fmt = TextFormatConfig()
-        if "format" in group_data:
-            fmt_data = group_data["format"]
-            if "type" in fmt_data:
-                fmt_type = fmt_data["type"]
-                if fmt_type not in ("number", "letter", "letter_upper", "custom"):
-                    raise ValueError(f"Invalid format.type value: {fmt_type}")
-                fmt.type = fmt_type
-            if "padding" in fmt_data:
-                fmt.padding = int(fmt_data["padding"])
-            if "start" in fmt_data:
-                fmt.start = int(fmt_data["start"])
-            if "custom" in fmt_data:
-                custom = fmt_data["custom"]
-                if not isinstance(custom, list):
-                    raise ValueError("format.custom must be a list")
-                fmt.custom = [str(item) for item in custom]
-
-            # Validate custom type requires custom labels
-            if fmt.type == "custom" and not fmt.custom:
-                raise ValueError("format.custom is required when type is 'custom'")
+        # Font and format (optional)
+        font = parse_font_config(group_data.get("font"))
+        fmt = parse_text_format_config(group_data.get("format"))
 
         # Align (optional)
         align: AlignType = "bbox_center"
@@ -687,6 +1324,9 @@ def parse_add_text_rule_file(rule_path: Path) -> AddTextRule:
                 )
             align = align_val
 
+        # Uniform width (optional)
+        uniform_width = bool(group_data.get("uniform_width", False))
+
         # Build TextLineRule with appropriate fields
         if has_horizontal:
             groups.append(
@@ -695,6 +1335,7 @@ def parse_add_text_rule_file(rule_path: Path) -> AddTextRule:
                     font=font,
                     format=fmt,
                     align=align,
+                    uniform_width=uniform_width,
                     y=float(group_data["y"]),
                     x_start=float(group_data["x_start"]),
                     x_end=float(group_data["x_end"]),
@@ -708,6 +1349,7 @@ def parse_add_text_rule_file(rule_path: Path) -> AddTextRule:
                     font=font,
                     format=fmt,
                     align=align,
+                    uniform_width=uniform_width,
                     x=float(group_data["x"]),
                     y_start=float(group_data["y_start"]),
                     y_end=float(group_data["y_end"]),
@@ -718,6 +1360,43 @@ def parse_add_text_rule_file(rule_path: Path) -> AddTextRule:
     return AddTextRule(groups=groups)
 
 
+# Characters each generated label format can contain
+_FORMAT_CHARSETS: dict[str, str] = {
+    "number": string.digits,
+    "letter": string.ascii_lowercase,
+    "letter_upper": string.ascii_uppercase,
+}
+
+
+def _prewarm_glyphs(rule: AddTextRule, dpi: int = 96) -> None:
+    """Load glyph metrics for every character the rule's labels can use.
+
+    Glyphs are loaded in one pass per font family so the per-label
+    measurement afterwards only does cached arithmetic.
+
+    Args:
+        rule: Add text rules.
+        dpi: DPI used for measurement.
+    """
+    charsets: dict[str, set[str]] = {}
+    for group_rule in rule.groups:
+        chars = charsets.setdefault(group_rule.font.family, set())
+        if group_rule.format.type == "custom":
+            chars.update(*group_rule.format.custom)
+        else:
+            chars.update(_FORMAT_CHARSETS.get(group_rule.format.type, ""))
+
+    char_size = int(MEASURE_FONT_SIZE_PT * 64)
+    for family, chars in charsets.items():
+        face = get_face(family)
+        if face is None:
+            continue
+        glyphs = _glyph_metrics_cache.setdefault(face, {}).setdefault(
+            (char_size, dpi), {}
+        )
+        _load_glyph_metrics(face, glyphs, sorted(chars), char_size, dpi)
+
+
 def add_text_to_svg_tree(
     tree: ET.ElementTree,
     rule: AddTextRule,
@@ -739,15 +1418,29 @@ def add_text_to_svg_tree(
     """
     root = tree.getroot()
     report = AddTextReport(file_path=Path(""))
+    _prewarm_glyphs(rule)
 
+    # Groups are built sequentially on purpose: cached FreeType faces carry
+    # per-face char size state and are not safe to share across threads, and
+    # the remaining per-element work is GIL-bound. Use svg_process --jobs to
+    # parallelize across files instead.
     for i, group_rule in enumerate(rule.groups):
         # Use group name as ID prefix
         id_prefix = f"{group_rule.name}-text"
 
         # base_indent=0 for root-level groups, child elements get indent level 1
-        group_elem, group_result = create_text_group(
-            group_rule, id_prefix, indent="  ", base_indent=0
-        )
+        if USING_LXML:
+            # libxml2 parses the pre-serialized group faster than the
+            # element-by-element DOM construction
+            group_xml, group_result = build_text_group_xml(
+                group_rule, id_prefix, indent="  ", base_indent=0
+            )
+            group_elem = ET.fromstring(group_xml)
+            group_elem.tail = "\n"
+        else:
+            group_elem, group_result = create_text_group(
+                group_rule, id_prefix, indent="  ", base_indent=0
+            )
         report.group_results.append(group_result)
 
         if apply and not group_result.has_errors:
@@ -771,18 +1464,126 @@ def add_text_to_svg(
     Returns:
         Tuple of (ElementTree, AddTextReport).
     """
-    register_namespaces()
-    tree = ET.parse(svg_path)
+    tree = load_svg(svg_path)
     report = add_text_to_svg_tree(tree, rule, apply)
     report.file_path = svg_path
     return tree, report
 
 
-def format_add_text_report(report: AddTextReport) -> str:
+# Splicing support: the closing root tag
+_SVG_CLOSE = b"</svg>"
+
+
+def _splice_root_attributes(data: bytes) -> dict[str, str] | None:
+    """Check that a document can be spliced and read its root start tag.
+
+    The whole document goes through expat, so malformed XML is rejected
+    here rather than spliced. The prolog, comments and CDATA are handled
+    by the parser, so the attributes belong to the actual root element.
+
+    Args:
+        data: Raw document bytes.
+
+    Returns:
+        Attributes of the root start tag, namespace declarations
+        included, or None if the document is not well-formed, is not
+        UTF-8, or its root is not an unprefixed <svg> in the SVG
+        namespace.
+    """
+    parser = expat.ParserCreate()
+    found: dict = {}
+
+    def on_xml_decl(version: str, encoding: str | None, standalone: int) -> None:
+        found["encoding"] = encoding
+
+    def on_root_start(name: str, attrs: dict[str, str]) -> None:
+        found["name"] = name
+        found["attrs"] = attrs
+        # Only the root is needed; parse the rest without callbacks
+        parser.StartElementHandler = None
+
+    parser.XmlDeclHandler = on_xml_decl
+    parser.StartElementHandler = on_root_start
+    try:
+        parser.Parse(data, True)
+    except expat.ExpatError:
+        return None
+
+    encoding = found.get("encoding")
+    if encoding is not None and encoding.lower() not in ("utf-8", "utf8"):
+        return None
+    attrs = found.get("attrs")
+    if (
+        found.get("name") != "svg"
+        or attrs is None
+        or attrs.get("xmlns") != SVG_NAMESPACES["svg"]
+    ):
+        return None
+    return attrs
+
+
+def splice_text_to_svg(
+    svg_path: Path,
+    rule: AddTextRule,
+) -> tuple[bytes, AddTextReport] | None:
+    """Add text groups by splicing them in before the closing </svg> tag.
+
+    Unlike add_text_to_svg(), the document is not built into a tree: it is
+    only checked for well-formedness, the original bytes are kept as-is
+    and the serialized groups are inserted before the closing root tag.
+    Groups with errors are left out, as with
+    add_text_to_svg_tree(apply=True).
+
+    Args:
+        svg_path: Path to SVG file.
+        rule: Add text rules.
+
+    Returns:
+        Tuple of (new document bytes, AddTextReport), or None if the
+        document cannot be spliced safely (malformed XML, non-UTF-8
+        encoding, root other than an SVG-namespaced <svg>, or content
+        after </svg>). Use add_text_to_svg() in that case.
+    """
+    data = Path(svg_path).read_bytes()
+
+    # With a well-formed document and an unprefixed root, a final </svg>
+    # followed only by whitespace is the root's end tag
+    end = data.rfind(_SVG_CLOSE)
+    if end < 0 or data[end + len(_SVG_CLOSE):].strip():
+        return None
+    root_attrs = _splice_root_attributes(data)
+    if root_attrs is None:
+        return None
+
+    # Skip redundant declarations when the root already binds both prefixes
+    declare = root_attrs.get("xmlns:inkscape") != SVG_NAMESPACES["inkscape"]
+
+    _prewarm_glyphs(rule)
+    report = AddTextReport(file_path=svg_path)
+    parts = [data[:end]]
+    for group_rule in rule.groups:
+        group_xml, group_result = build_text_group_xml(
+            group_rule,
+            f"{group_rule.name}-text",
+            indent="  ",
+            base_indent=0,
+            declare_namespaces=declare,
+        )
+        report.group_results.append(group_result)
+        if not group_result.has_errors:
+            parts.append(group_xml)
+            parts.append(b"\n")
+    parts.append(data[end:])
+
+    return b"".join(parts), report
+
+
+def format_add_text_report(report: AddTextReport, summary_only: bool = False) -> str:
     """Format add-text report as text.
 
     Args:
         report: Add text report.
+        summary_only: If True, omit the per-element listing.
 
     Returns:
         Formatted text.
@@ -827,7 +1628,7 @@ def format_add_text_report(report: AddTextReport) -> str:
             lines.append("")
 
         # Element list
-        if group_result.elements:
+        if group_result.elements and not summary_only:
             lines.append("  Created elements:")
             for elem in group_result.elements:
                 lines.append(
@@ -4,9 +4,6 @@ import math
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterator, Literal
-from xml.etree import ElementTree as ET
-
-import yaml
 
 from .geometry import (
     ArcInfo,
@@ -24,7 +21,14 @@ from .geometry import (
     update_path,
     update_rect,
 )
-from .utils import find_all_groups_by_label, register_namespaces
+from .utils import (
+    ET,
+    find_all_groups_by_label,
+    index_groups_by_label,
+    iter_by_local_name,
+    load_svg,
+    load_yaml,
+)
 
 # Default values
 DEFAULT_TOLERANCE = 0.001  # mm or rad
@@ -87,7 +91,7 @@ class AlignmentRule:
 IssueStatus = Literal["ok", "fixable", "error"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Issue:
     """A single validation issue."""
 
@@ -100,31 +104,52 @@ class Issue:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
-    """Validation result for a single element."""
+    """Validation result for a single element.
+
+    Error and fixable counts are tallied from ``issues`` at construction;
+    use ``add_issue`` rather than appending to ``issues`` directly.
+    """
 
     element_id: str
     shape_type: ShapeType
     issues: list[Issue] = field(default_factory=list)
+    error_count: int = field(default=0, init=False)
+    fixable_count: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        for issue in self.issues:
+            self._count(issue)
+
+    def _count(self, issue: Issue) -> None:
+        if issue.status == "error":
+            self.error_count += 1
+        elif issue.status == "fixable":
+            self.fixable_count += 1
+
+    def add_issue(self, issue: Issue) -> None:
+        """Append an issue and update the counts."""
+        self.issues.append(issue)
+        self._count(issue)
 
     @property
     def has_errors(self) -> bool:
         """Check if any issues are errors."""
-        return any(issue.status == "error" for issue in self.issues)
+        return self.error_count > 0
 
     @property
     def has_fixable(self) -> bool:
         """Check if any issues are fixable."""
-        return any(issue.status == "fixable" for issue in self.issues)
+        return self.fixable_count > 0
 
     @property
     def is_ok(self) -> bool:
         """Check if all issues are ok."""
-        return all(issue.status == "ok" for issue in self.issues)
+        return self.error_count == 0 and self.fixable_count == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupValidationResult:
     """Validation result for a group."""
 
@@ -154,33 +179,56 @@ class GroupValidationResult:
         """Count elements that are ok."""
         return sum(1 for r in self.element_results if r.is_ok)
 
+    def tally(self) -> tuple[int, int, int]:
+        """Count ok, fixable and error elements in a single pass.
 
-@dataclass
+        Returns:
+            Tuple of (ok_count, fixable_count, error_count).
+        """
+        ok = fixable = errors = 0
+        for r in self.element_results:
+            if r.error_count:
+                errors += 1
+            elif r.fixable_count:
+                fixable += 1
+            else:
+                ok += 1
+        return ok, fixable, errors
+
+
+@dataclass(slots=True)
 class AlignmentReport:
-    """Complete alignment report."""
+    """Complete alignment report.
+
+    Totals are tallied from ``group_results`` at construction; use
+    ``add_group`` rather than appending to ``group_results`` directly.
+    """
 
     file_path: Path
     group_results: list[GroupValidationResult] = field(default_factory=list)
+    total_elements: int = field(default=0, init=False)
+    total_errors: int = field(default=0, init=False)
+    total_fixable: int = field(default=0, init=False)
 
-    @property
-    def has_errors(self) -> bool:
-        """Check if any groups have errors."""
-        return any(g.has_errors for g in self.group_results)
+    def __post_init__(self) -> None:
+        for group_result in self.group_results:
+            self._count(group_result)
 
-    @property
-    def total_elements(self) -> int:
-        """Total number of elements checked."""
-        return sum(len(g.element_results) for g in self.group_results)
+    def _count(self, group_result: GroupValidationResult) -> None:
+        _, fixable, errors = group_result.tally()
+        self.total_elements += len(group_result.element_results)
+        self.total_errors += errors
+        self.total_fixable += fixable
 
-    @property
-    def total_errors(self) -> int:
-        """Total number of elements with errors."""
-        return sum(g.error_count for g in self.group_results)
+    def add_group(self, group_result: GroupValidationResult) -> None:
+        """Append a group result and update the totals."""
+        self.group_results.append(group_result)
+        self._count(group_result)
 
     @property
-    def total_fixable(self) -> int:
-        """Total number of elements with fixable issues."""
-        return sum(g.fixable_count for g in self.group_results)
+    def has_errors(self) -> bool:
+        """Check if any groups have errors."""
+        return self.total_errors > 0
 
 
 def parse_rule_file(rule_path: Path) -> AlignmentRule:
@@ -197,8 +245,7 @@ def parse_rule_file(rule_path: Path) -> AlignmentRule:
         yaml.YAMLError: If the file is not valid YAML.
         ValueError: If the rule format is invalid.
     """
-    with open(rule_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = load_yaml(rule_path)
 
     if not isinstance(data, dict):
         raise ValueError("Rule file must be a YAML dictionary")
@@ -249,6 +296,14 @@ def parse_rule_file(rule_path: Path) -> AlignmentRule:
     return AlignmentRule(groups=groups, tolerance=tolerance)
 
 
+# Element local name and parser per shape type; arcs are sodipodi-typed paths
+_SHAPE_SOURCES = {
+    "rect": ("rect", parse_rect),
+    "arc": ("path", parse_arc),
+    "path": ("path", parse_path),
+}
+
+
 def iter_shapes_in_group(
     group: ET.Element, shape_type: ShapeType
 ) -> Iterator[ShapeInfo]:
@@ -261,20 +316,91 @@ def iter_shapes_in_group(
     Yields:
         ShapeInfo for each matching shape.
     """
-    for elem in group.iter():
-        if shape_type == "rect":
-            info = parse_rect(elem)
-        elif shape_type == "arc":
-            info = parse_arc(elem)
-        elif shape_type == "path":
-            info = parse_path(elem)
-        else:
-            continue
-
+    source = _SHAPE_SOURCES.get(shape_type)
+    if source is None:
+        return
+    local_name, parser = source
+
+    # Unrelated children are skipped without calling the parser
+    for elem in iter_by_local_name(group, local_name):
+        info = parser(elem)
         if info is not None:
             yield info
 
 
+def _value_issue(
+    element_id: str,
+    field_name: str,
+    actual: float,
+    expected: float,
+    acceptable: float,
+    error_threshold: float,
+) -> Issue | None:
+    """Check a value against its expected value.
+
+    Args:
+        element_id: Element ID for the issue.
+        field_name: Name of the checked field.
+        actual: Actual value.
+        expected: Expected value.
+        acceptable: Acceptable deviation.
+        error_threshold: Maximum fixable deviation ratio.
+
+    Returns:
+        Issue if the value is not ok, None otherwise.
+    """
+    status, dev = check_value_match(actual, expected, acceptable, error_threshold)
+    if status == "ok":
+        return None
+    return Issue(
+        element_id=element_id,
+        field=field_name,
+        status=status,
+        actual=actual,
+        expected=expected,
+        deviation=dev,
+        message=f"{field_name}={actual:.6f} (expected: {expected})",
+    )
+
+
+def _grid_issue(
+    element_id: str,
+    field_name: str,
+    value: float,
+    grid_unit: float,
+    acceptable: float,
+    error_threshold: float,
+) -> Issue | None:
+    """Check a value for grid alignment.
+
+    Args:
+        element_id: Element ID for the issue.
+        field_name: Name of the checked field.
+        value: Coordinate value.
+        grid_unit: Grid unit size.
+        acceptable: Acceptable deviation.
+        error_threshold: Maximum fixable deviation ratio.
+
+    Returns:
+        Issue if the value is off-grid, None otherwise.
+    """
+    aligned, dev = check_grid_alignment(value, grid_unit, acceptable)
+    if aligned:
+        return None
+    # Check if deviation is within error threshold
+    ratio = dev / grid_unit if grid_unit != 0 else dev
+    status: IssueStatus = "fixable" if ratio <= error_threshold else "error"
+    return Issue(
+        element_id=element_id,
+        field=field_name,
+        status=status,
+        actual=value,
+        expected=snap_to_grid(value, grid_unit),
+        deviation=dev,
+        message=f"{field_name}={value:.6f} (remainder: {dev:.6f})",
+    )
+
+
 def validate_rect(
     info: RectInfo,
     rule: GroupRule,
@@ -290,88 +416,65 @@ def validate_rect(
     Returns:
         Validation result.
     """
-    result = ValidationResult(element_id=info.id, shape_type="rect")
+    element_id = info.id
+    acceptable = tolerance.acceptable
+    error_threshold = tolerance.error_threshold
+    checks: list[Issue | None] = []
 
     # Check size
-    if rule.size:
-        # Width
-        status, dev = check_value_match(
-            info.width,
-            rule.size.width,
-            tolerance.acceptable,
-            tolerance.error_threshold,
-        )
-        if status != "ok":
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="width",
-                    status=status,
-                    actual=info.width,
-                    expected=rule.size.width,
-                    deviation=dev,
-                    message=f"width={info.width:.6f} (expected: {rule.size.width})",
-                )
+    size = rule.size
+    if size:
+        checks.append(
+            _value_issue(
+                element_id,
+                "width",
+                info.width,
+                size.width,
+                acceptable,
+                error_threshold,
             )
-
-        # Height
-        status, dev = check_value_match(
-            info.height,
-            rule.size.height,
-            tolerance.acceptable,
-            tolerance.error_threshold,
         )
-        if status != "ok":
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="height",
-                    status=status,
-                    actual=info.height,
-                    expected=rule.size.height,
-                    deviation=dev,
-                    message=f"height={info.height:.6f} (expected: {rule.size.height})",
-                )
+        checks.append(
+            _value_issue(
+                element_id,
+                "height",
+                info.height,
+                size.height,
+                acceptable,
+                error_threshold,
             )
+        )
 
     # Check grid alignment (after size check, using current center)
-    if rule.grid:
+    grid = rule.grid
+    if grid:
         center_x, center_y = info.center
-
-        aligned, dev = check_grid_alignment(center_x, rule.grid.x, tolerance.acceptable)
-        if not aligned:
-            # Check if deviation is within error threshold
-            ratio = dev / rule.grid.x if rule.grid.x != 0 else dev
-            status: IssueStatus = "fixable" if ratio <= tolerance.error_threshold else "error"
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="center_x",
-                    status=status,
-                    actual=center_x,
-                    expected=snap_to_grid(center_x, rule.grid.x),
-                    deviation=dev,
-                    message=f"center_x={center_x:.6f} (remainder: {dev:.6f})",
-                )
+        checks.append(
+            _grid_issue(
+                element_id,
+                "center_x",
+                center_x,
+                grid.x,
+                acceptable,
+                error_threshold,
             )
-
-        aligned, dev = check_grid_alignment(center_y, rule.grid.y, tolerance.acceptable)
-        if not aligned:
-            ratio = dev / rule.grid.y if rule.grid.y != 0 else dev
-            status = "fixable" if ratio <= tolerance.error_threshold else "error"
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="center_y",
-                    status=status,
-                    actual=center_y,
-                    expected=snap_to_grid(center_y, rule.grid.y),
-                    deviation=dev,
-                    message=f"center_y={center_y:.6f} (remainder: {dev:.6f})",
-                )
+        )
+        checks.append(
+            _grid_issue(
+                element_id,
+                "center_y",
+                center_y,
+                grid.y,
+                acceptable,
+                error_threshold,
             )
+        )
 
-    return result
+    return ValidationResult(
+        element_id=element_id,
+        shape_type="rect",
+        issues=[issue for issue in checks if issue is not None],
+    )
 
 
 def validate_arc(
@@ -389,128 +492,88 @@ def validate_arc(
     Returns:
         Validation result.
     """
-    result = ValidationResult(element_id=info.id, shape_type="arc")
+    element_id = info.id
+    acceptable = tolerance.acceptable
+    error_threshold = tolerance.error_threshold
+    checks: list[Issue | None] = []
 
     # Check arc parameters (start/end)
-    if rule.arc:
-        # Start
-        status, dev = check_value_match(
-            info.start,
-            rule.arc.start,
-            tolerance.acceptable,
-            tolerance.error_threshold,
-        )
-        if status != "ok":
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="start",
-                    status=status,
-                    actual=info.start,
-                    expected=rule.arc.start,
-                    deviation=dev,
-                    message=f"start={info.start:.6f} (expected: {rule.arc.start})",
-                )
+    arc = rule.arc
+    if arc:
+        checks.append(
+            _value_issue(
+                element_id,
+                "start",
+                info.start,
+                arc.start,
+                acceptable,
+                error_threshold,
             )
-
-        # End
-        status, dev = check_value_match(
-            info.end,
-            rule.arc.end,
-            tolerance.acceptable,
-            tolerance.error_threshold,
         )
-        if status != "ok":
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="end",
-                    status=status,
-                    actual=info.end,
-                    expected=rule.arc.end,
-                    deviation=dev,
-                    message=f"end={info.end:.6f} (expected: {rule.arc.end})",
-                )
+        checks.append(
+            _value_issue(
+                element_id,
+                "end",
+                info.end,
+                arc.end,
+                acceptable,
+                error_threshold,
             )
+        )
 
     # Check size (diameter)
-    if rule.size:
-        diameter_x = info.rx * 2
-        diameter_y = info.ry * 2
-
-        status, dev = check_value_match(
-            diameter_x,
-            rule.size.width,
-            tolerance.acceptable,
-            tolerance.error_threshold,
-        )
-        if status != "ok":
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="diameter_x",
-                    status=status,
-                    actual=diameter_x,
-                    expected=rule.size.width,
-                    deviation=dev,
-                    message=f"diameter_x={diameter_x:.6f} (expected: {rule.size.width})",
-                )
+    size = rule.size
+    if size:
+        checks.append(
+            _value_issue(
+                element_id,
+                "diameter_x",
+                info.rx * 2,
+                size.width,
+                acceptable,
+                error_threshold,
             )
-
-        status, dev = check_value_match(
-            diameter_y,
-            rule.size.height,
-            tolerance.acceptable,
-            tolerance.error_threshold,
         )
-        if status != "ok":
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="diameter_y",
-                    status=status,
-                    actual=diameter_y,
-                    expected=rule.size.height,
-                    deviation=dev,
-                    message=f"diameter_y={diameter_y:.6f} (expected: {rule.size.height})",
-                )
+        checks.append(
+            _value_issue(
+                element_id,
+                "diameter_y",
+                info.ry * 2,
+                size.height,
+                acceptable,
+                error_threshold,
             )
+        )
 
     # Check grid alignment
-    if rule.grid:
-        aligned, dev = check_grid_alignment(info.cx, rule.grid.x, tolerance.acceptable)
-        if not aligned:
-            ratio = dev / rule.grid.x if rule.grid.x != 0 else dev
-            status: IssueStatus = "fixable" if ratio <= tolerance.error_threshold else "error"
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="center_x",
-                    status=status,
-                    actual=info.cx,
-                    expected=snap_to_grid(info.cx, rule.grid.x),
-                    deviation=dev,
-                    message=f"center_x={info.cx:.6f} (remainder: {dev:.6f})",
-                )
+    grid = rule.grid
+    if grid:
+        checks.append(
+            _grid_issue(
+                element_id,
+                "center_x",
+                info.cx,
+                grid.x,
+                acceptable,
+                error_threshold,
             )
-
-        aligned, dev = check_grid_alignment(info.cy, rule.grid.y, tolerance.acceptable)
-        if not aligned:
-            ratio = dev / rule.grid.y if rule.grid.y != 0 else dev
-            status = "fixable" if ratio <= tolerance.error_threshold else "error"
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="center_y",
-                    status=status,
-                    actual=info.cy,
-                    expected=snap_to_grid(info.cy, rule.grid.y),
-                    deviation=dev,
-                    message=f"center_y={info.cy:.6f} (remainder: {dev:.6f})",
-                )
+        )
+        checks.append(
+            _grid_issue(
+                element_id,
+                "center_y",
+                info.cy,
+                grid.y,
+                acceptable,
+                error_threshold,
             )
+        )
 
-    return result
+    return ValidationResult(
+        element_id=element_id,
+        shape_type="arc",
+        issues=[issue for issue in checks if issue is not None],
+    )
 
 
 def validate_path(
@@ -530,76 +593,44 @@ def validate_path(
     Returns:
         Validation result.
     """
-    result = ValidationResult(element_id=info.id, shape_type="path")
-
-    # Check grid alignment for start point
-    if rule.grid:
-        aligned, dev = check_grid_alignment(info.start_x, rule.grid.x, tolerance.acceptable)
-        if not aligned:
-            ratio = dev / rule.grid.x if rule.grid.x != 0 else dev
-            status: IssueStatus = "fixable" if ratio <= tolerance.error_threshold else "error"
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="start_x",
-                    status=status,
-                    actual=info.start_x,
-                    expected=snap_to_grid(info.start_x, rule.grid.x),
-                    deviation=dev,
-                    message=f"start_x={info.start_x:.6f} (remainder: {dev:.6f})",
+    element_id = info.id
+    checks: list[Issue | None] = []
+
+    # Check grid alignment for start and end points
+    grid = rule.grid
+    if grid:
+        acceptable = tolerance.acceptable
+        error_threshold = tolerance.error_threshold
+        for field_name, value, grid_unit in (
+            ("start_x", info.start_x, grid.x),
+            ("start_y", info.start_y, grid.y),
+            ("end_x", info.end_x, grid.x),
+            ("end_y", info.end_y, grid.y),
+        ):
+            checks.append(
+                _grid_issue(
+                    element_id,
+                    field_name,
+                    value,
+                    grid_unit,
+                    acceptable,
+                    error_threshold,
                 )
             )
 
-        aligned, dev = check_grid_alignment(info.start_y, rule.grid.y, tolerance.acceptable)
-        if not aligned:
-            ratio = dev / rule.grid.y if rule.grid.y != 0 else dev
-            status = "fixable" if ratio <= tolerance.error_threshold else "error"
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="start_y",
-                    status=status,
-                    actual=info.start_y,
-                    expected=snap_to_grid(info.start_y, rule.grid.y),
-                    deviation=dev,
-                    message=f"start_y={info.start_y:.6f} (remainder: {dev:.6f})",
-                )
-            )
+    return ValidationResult(
+        element_id=element_id,
+        shape_type="path",
+        issues=[issue for issue in checks if issue is not None],
+    )
 
-        # Check grid alignment for end point
-        aligned, dev = check_grid_alignment(info.end_x, rule.grid.x, tolerance.acceptable)
-        if not aligned:
-            ratio = dev / rule.grid.x if rule.grid.x != 0 else dev
-            status = "fixable" if ratio <= tolerance.error_threshold else "error"
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="end_x",
-                    status=status,
-                    actual=info.end_x,
-                    expected=snap_to_grid(info.end_x, rule.grid.x),
-                    deviation=dev,
-                    message=f"end_x={info.end_x:.6f} (remainder: {dev:.6f})",
-                )
-            )
 
-        aligned, dev = check_grid_alignment(info.end_y, rule.grid.y, tolerance.acceptable)
-        if not aligned:
-            ratio = dev / rule.grid.y if rule.grid.y != 0 else dev
-            status = "fixable" if ratio <= tolerance.error_threshold else "error"
-            result.issues.append(
-                Issue(
-                    element_id=info.id,
-                    field="end_y",
-                    status=status,
-                    actual=info.end_y,
-                    expected=snap_to_grid(info.end_y, rule.grid.y),
-                    deviation=dev,
-                    message=f"end_y={info.end_y:.6f} (remainder: {dev:.6f})",
-                )
-            )
-
-    return result
+# Validator per shape info type (exact type lookup, no isinstance chain)
+_VALIDATORS = {
+    RectInfo: validate_rect,
+    ArcInfo: validate_arc,
+    PathInfo: validate_path,
+}
 
 
 def validate_shape(
@@ -617,14 +648,10 @@ def validate_shape(
     Returns:
         Validation result.
     """
-    if isinstance(info, RectInfo):
-        return validate_rect(info, rule, tolerance)
-    elif isinstance(info, ArcInfo):
-        return validate_arc(info, rule, tolerance)
-    elif isinstance(info, PathInfo):
-        return validate_path(info, rule, tolerance)
-    else:
+    validator = _VALIDATORS.get(type(info))
+    if validator is None:
         raise ValueError(f"Unknown shape type: {type(info)}")
+    return validator(info, rule, tolerance)
 
 
 def fix_rect(
@@ -643,35 +670,32 @@ def fix_rect(
     """
     new_width = info.width
     new_height = info.height
+    new_center_x: float | None = None
+    new_center_y: float | None = None
 
-    # Fix size first
+    # Single pass: apply size fixes now, stage position fixes
     for issue in result.issues:
         if issue.status != "fixable":
             continue
 
-        if issue.field == "width" and rule.size:
+        field_name = issue.field
+        if field_name == "width" and rule.size:
             new_width = rule.size.width
             update_rect(info.element, width=new_width)
-        elif issue.field == "height" and rule.size:
+        elif field_name == "height" and rule.size:
             new_height = rule.size.height
             update_rect(info.element, height=new_height)
-
-    # Fix position (recalculate center with new size)
-    for issue in result.issues:
-        if issue.status != "fixable":
-            continue
-
-        if issue.field == "center_x" and rule.grid:
-            # Current x + new_width/2 = current_center
-            # New center = snapped value
-            # New x = new_center - new_width/2
+        elif field_name == "center_x" and rule.grid:
             new_center_x = issue.expected
-            new_x = new_center_x - new_width / 2
-            update_rect(info.element, x=new_x)
-        elif issue.field == "center_y" and rule.grid:
+        elif field_name == "center_y" and rule.grid:
             new_center_y = issue.expected
-            new_y = new_center_y - new_height / 2
-            update_rect(info.element, y=new_y)
+
+    # Fix position (recalculate corner with new size)
+    # New center = snapped value, new x = new_center - new_width/2
+    if new_center_x is not None:
+        update_rect(info.element, x=new_center_x - new_width / 2)
+    if new_center_y is not None:
+        update_rect(info.element, y=new_center_y - new_height / 2)
 
 
 def fix_arc(
@@ -688,34 +712,31 @@ def fix_arc(
         result: Validation result.
         rule: Group rule.
     """
-    new_rx = info.rx
-    new_ry = info.ry
+    new_cx: float | None = None
+    new_cy: float | None = None
 
-    # Fix arc params and size first
+    # Single pass: apply arc params and size fixes now, stage position fixes
     for issue in result.issues:
         if issue.status != "fixable":
             continue
 
-        if issue.field == "start" and rule.arc:
+        field_name = issue.field
+        if field_name == "start" and rule.arc:
             update_arc(info.element, start=rule.arc.start)
-        elif issue.field == "end" and rule.arc:
+        elif field_name == "end" and rule.arc:
             update_arc(info.element, end=rule.arc.end)
-        elif issue.field == "diameter_x" and rule.size:
-            new_rx = rule.size.width / 2
-            update_arc(info.element, rx=new_rx)
-        elif issue.field == "diameter_y" and rule.size:
-            new_ry = rule.size.height / 2
-            update_arc(info.element, ry=new_ry)
+        elif field_name == "diameter_x" and rule.size:
+            update_arc(info.element, rx=rule.size.width / 2)
+        elif field_name == "diameter_y" and rule.size:
+            update_arc(info.element, ry=rule.size.height / 2)
+        elif field_name == "center_x" and rule.grid:
+            new_cx = issue.expected
+        elif field_name == "center_y" and rule.grid:
+            new_cy = issue.expected
 
     # Fix position
-    for issue in result.issues:
-        if issue.status != "fixable":
-            continue
-
-        if issue.field == "center_x" and rule.grid:
-            update_arc(info.element, cx=issue.expected)
-        elif issue.field == "center_y" and rule.grid:
-            update_arc(info.element, cy=issue.expected)
+    if new_cx is not None or new_cy is not None:
+        update_arc(info.element, cx=new_cx, cy=new_cy)
 
 
 def fix_path(
@@ -750,17 +771,26 @@ def fix_path(
         elif issue.field == "end_y" and rule.grid:
             new_end_y = issue.expected
 
-    # Apply all fixes at once
+    # Apply all fixes at once; passing every coordinate lets update_path
+    # skip re-parsing the d attribute
     if any(v is not None for v in [new_start_x, new_start_y, new_end_x, new_end_y]):
         update_path(
             info.element,
-            start_x=new_start_x,
-            start_y=new_start_y,
-            end_x=new_end_x,
-            end_y=new_end_y,
+            start_x=new_start_x if new_start_x is not None else info.start_x,
+            start_y=new_start_y if new_start_y is not None else info.start_y,
+            end_x=new_end_x if new_end_x is not None else info.end_x,
+            end_y=new_end_y if new_end_y is not None else info.end_y,
         )
 
 
+# Fixer per shape info type
+_FIXERS = {
+    RectInfo: fix_rect,
+    ArcInfo: fix_arc,
+    PathInfo: fix_path,
+}
+
+
 def fix_shape(
     info: ShapeInfo,
     result: ValidationResult,
@@ -773,12 +803,9 @@ def fix_shape(
         result: Validation result.
         rule: Group rule.
     """
-    if isinstance(info, RectInfo):
-        fix_rect(info, result, rule)
-    elif isinstance(info, ArcInfo):
-        fix_arc(info, result, rule)
-    elif isinstance(info, PathInfo):
-        fix_path(info, result, rule)
+    fixer = _FIXERS.get(type(info))
+    if fixer is not None:
+        fixer(info, result, rule)
 
 
 def validate_and_fix_group(
@@ -786,6 +813,7 @@ def validate_and_fix_group(
     rule: GroupRule,
     tolerance: ToleranceConfig,
     fix: bool = False,
+    groups: list[ET.Element] | None = None,
 ) -> GroupValidationResult:
     """Validate and optionally fix shapes in a group.
 
@@ -794,11 +822,14 @@ def validate_and_fix_group(
         rule: Group rule.
         tolerance: Tolerance configuration.
         fix: Whether to fix fixable issues.
+        groups: Groups matching rule.name, if already resolved (e.g. from
+            index_groups_by_label). Looked up in root when None.
 
     Returns:
         Group validation result.
     """
-    groups = find_all_groups_by_label(root, rule.name)
+    if groups is None:
+        groups = find_all_groups_by_label(root, rule.name)
     result = GroupValidationResult(group_name=rule.name, shape_type=rule.shape)
 
     if not groups:
@@ -809,7 +840,7 @@ def validate_and_fix_group(
             validation = validate_shape(info, rule, tolerance)
             result.element_results.append(validation)
 
-            if fix and validation.has_fixable and not validation.has_errors:
+            if fix and validation.fixable_count and not validation.error_count:
                 fix_shape(info, validation, rule)
 
     return result
@@ -837,11 +868,17 @@ def validate_svg_tree(
     root = tree.getroot()
     report = AlignmentReport(file_path=Path(""))
 
+    # Resolve every rule's groups with one tree walk
+    group_index = index_groups_by_label(root)
     for group_rule in rule.groups:
         group_result = validate_and_fix_group(
-            root, group_rule, rule.tolerance, fix=fix
+            root,
+            group_rule,
+            rule.tolerance,
+            fix=fix,
+            groups=group_index.get(group_rule.name, []),
         )
-        report.group_results.append(group_result)
+        report.add_group(group_result)
 
     return report
 
@@ -861,18 +898,19 @@ def validate_svg(
     Returns:
         Tuple of (ElementTree, AlignmentReport).
     """
-    register_namespaces()
-    tree = ET.parse(svg_path)
+    tree = load_svg(svg_path)
     report = validate_svg_tree(tree, rule, fix)
     report.file_path = svg_path
     return tree, report
 
 
-def format_report(report: AlignmentReport) -> str:
+def format_report(report: AlignmentReport, summary_only: bool = False) -> str:
     """Format alignment report as text.
 
     Args:
         report: Alignment report.
+        summary_only: If True, list only elements with errors (skip
+            fixable ones).
 
     Returns:
         Formatted text.
@@ -885,17 +923,17 @@ def format_report(report: AlignmentReport) -> str:
     lines.append("")
 
     for group_result in report.group_results:
+        ok, fixable, errors = group_result.tally()
         lines.append(f"Group: {group_result.group_name} ({group_result.shape_type})")
-        lines.append(
-            f"  OK: {group_result.ok_count}, "
-            f"Fixable: {group_result.fixable_count}, "
-            f"Errors: {group_result.error_count}"
-        )
+        lines.append(f"  OK: {ok}, Fixable: {fixable}, Errors: {errors}")
 
         # List elements with issues
         for elem_result in group_result.element_results:
-            if not elem_result.is_ok:
-                status_str = "ERROR" if elem_result.has_errors else "FIXABLE"
+            if not elem_result.issues:
+                continue
+            has_errors = elem_result.has_errors
+            if has_errors or (not summary_only and not elem_result.is_ok):
+                status_str = "ERROR" if has_errors else "FIXABLE"
                 lines.append(f"  [{status_str}] {elem_result.element_id}")
                 for issue in elem_result.issues:
                     if issue.status != "ok":
@@ -903,7 +941,7 @@ def format_report(report: AlignmentReport) -> str:
 
         lines.append("")
 
-    if report.has_errors:
+    if report.total_errors:
         lines.append("*** ERRORS DETECTED - Output file will not be generated ***")
     elif report.total_fixable > 0:
         lines.append("All fixable issues can be corrected.")
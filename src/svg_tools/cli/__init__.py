@@ -0,0 +1 @@
+"""Command-line entry points for SVG Tools."""
@@ -0,0 +1,306 @@
+"""Process SVG files through unified pipeline (align -> relabel -> add_text)."""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from ..process import (
+    ALL_STEPS,
+    ProcessRule,
+    StepName,
+    format_process_report,
+    parse_process_rule_file,
+    process_svg,
+)
+from ..utils import write_svg
+
+
+def _positive_int(value: str) -> int:
+    """Parse a positive integer command-line argument.
+
+    Args:
+        value: Argument text.
+
+    Returns:
+        Parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer >= 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {number}")
+    return number
+
+
+def parse_steps(steps_arg: str | None) -> list[StepName]:
+    """Parse steps argument.
+
+    Args:
+        steps_arg: Comma-separated step names or 'all'.
+
+    Returns:
+        List of step names to execute.
+
+    Raises:
+        ValueError: If invalid step name is provided.
+    """
+    if steps_arg is None or steps_arg.lower() == "all":
+        return list(ALL_STEPS)
+
+    steps: list[StepName] = []
+    for step in steps_arg.split(","):
+        step = step.strip().lower()
+        if step not in ALL_STEPS:
+            valid_steps = ", ".join(ALL_STEPS)
+            raise ValueError(f"Invalid step '{step}'. Valid steps: {valid_steps}, all")
+        steps.append(step)  # type: ignore
+
+    return steps
+
+
+def _process_one(
+    svg_file: Path,
+    rule: ProcessRule,
+    steps: list[StepName],
+    output: Path | None,
+    dry_run: bool,
+    quiet: bool = False,
+) -> tuple[int, str, str]:
+    """Process a single SVG file and write its output.
+
+    Defined at module level so it can be dispatched to worker processes.
+
+    Args:
+        svg_file: Path to SVG file to process.
+        rule: Parsed unified rule.
+        steps: Steps to execute.
+        output: Output SVG file path, or None for validation only.
+        dry_run: If True, do not write output.
+        quiet: If True, only report (in summary form) when errors are found.
+
+    Returns:
+        Tuple of (exit code, stdout text, stderr text).
+    """
+    out: list[str] = []
+    err: list[str] = []
+
+    if not svg_file.exists():
+        err.append(f"Error: SVG file not found: {svg_file}")
+        return 1, "", "\n".join(err)
+
+    # Determine if we should apply changes
+    apply = output is not None and not dry_run
+
+    # Process SVG
+    try:
+        tree, report = process_svg(svg_file, rule, steps=steps, apply=apply)
+    except Exception as e:
+        err.append(f"Error: Failed to process SVG: {e}")
+        return 1, "", "\n".join(err)
+
+    # Report
+    if not quiet:
+        out.append(format_process_report(report))
+    elif report.has_errors:
+        out.append(format_process_report(report, summary_only=True))
+
+    # Handle output
+    if output and not dry_run:
+        if report.has_errors:
+            err.append("\nError: Cannot write output due to errors above.")
+            return 3, "\n".join(out), "\n".join(err)
+        try:
+            write_svg(tree, output)
+            if not quiet:
+                out.append(f"\nOutput written to: {output}")
+        except Exception as e:
+            err.append(f"Error: Failed to write output: {e}")
+            return 1, "\n".join(out), "\n".join(err)
+
+    # Return appropriate exit code
+    if report.has_errors:
+        return 3, "\n".join(out), "\n".join(err)
+
+    return 0, "\n".join(out), "\n".join(err)
+
+
+def _emit(stdout_text: str, stderr_text: str) -> None:
+    """Print captured output of a processed file."""
+    if stdout_text:
+        print(stdout_text)
+    if stderr_text:
+        print(stderr_text, file=sys.stderr)
+
+
+def main() -> int:
+    """Main entry point.
+
+    Returns:
+        Exit code (highest over all input files):
+        - 0: Success
+        - 1: I/O error
+        - 2: Rule file error
+        - 3: Processing errors detected
+    """
+    parser = argparse.ArgumentParser(
+        description="Process SVG files through unified pipeline (align -> relabel -> add_text).",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Validate only (no output file)
+  %(prog)s input.svg --rule rules.yaml
+
+  # Process and save output
+  %(prog)s input.svg --rule rules.yaml --output output.svg
+
+  # Process multiple files in parallel (output is a directory)
+  %(prog)s a.svg b.svg c.svg --rule rules.yaml --output out_dir/
+
+  # Run specific steps only
+  %(prog)s input.svg --rule rules.yaml --steps align,relabel --output output.svg
+
+  # Dry run (preview changes without writing)
+  %(prog)s input.svg --rule rules.yaml --output output.svg --dry-run
+""",
+    )
+    parser.add_argument(
+        "svg_file", type=Path, nargs="+", help="Path to SVG file(s) to process"
+    )
+    parser.add_argument(
+        "--rule", "-r", type=Path, required=True, help="Path to unified YAML rule file"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        help="Output SVG file, or output directory for multiple inputs (enables processing)",
+    )
+    parser.add_argument(
+        "--steps",
+        "-s",
+        type=str,
+        default="all",
+        help="Steps to execute: align,relabel,add_text or 'all' (default: all)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Preview changes without writing output",
+    )
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Only print a summary report when errors are found",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes for multiple inputs (default: CPU count)",
+    )
+
+    args = parser.parse_args()
+    svg_files: list[Path] = args.svg_file
+
+    # Validate input files exist
+    if len(svg_files) == 1 and not svg_files[0].exists():
+        print(f"Error: SVG file not found: {svg_files[0]}", file=sys.stderr)
+        return 1
+
+    if not args.rule.exists():
+        print(f"Error: Rule file not found: {args.rule}", file=sys.stderr)
+        return 1
+
+    # Multiple inputs write into an output directory, one file per basename
+    if len(svg_files) > 1 and args.output is not None and not args.dry_run:
+        if args.output.exists() and not args.output.is_dir():
+            print(
+                f"Error: --output must be a directory for multiple inputs: {args.output}",
+                file=sys.stderr,
+            )
+            return 1
+        seen: dict[str, Path] = {}
+        for svg_file in svg_files:
+            other = seen.setdefault(svg_file.name, svg_file)
+            if other is not svg_file:
+                print(
+                    f"Error: Inputs {other} and {svg_file} would both be written "
+                    f"to {args.output / svg_file.name}",
+                    file=sys.stderr,
+                )
+                return 1
+        args.output.mkdir(parents=True, exist_ok=True)
+
+    # Parse steps
+    try:
+        steps = parse_steps(args.steps)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    # Parse rule file once in the parent process
+    try:
+        rule = parse_process_rule_file(args.rule)
+    except Exception as e:
+        print(f"Error: Failed to parse rule file: {e}", file=sys.stderr)
+        return 2
+
+    # Single file: process in-process
+    if len(svg_files) == 1:
+        code, out, err = _process_one(
+            svg_files[0], rule, steps, args.output, args.dry_run, args.quiet
+        )
+        _emit(out, err)
+        return code
+
+    # Multiple files: dispatch to a process pool
+    outputs = [
+        args.output / svg_file.name if args.output is not None else None
+        for svg_file in svg_files
+    ]
+    n = len(svg_files)
+    max_workers = min(n, args.jobs or os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                _process_one,
+                svg_files,
+                [rule] * n,
+                [steps] * n,
+                outputs,
+                [args.dry_run] * n,
+                [args.quiet] * n,
+                chunksize=4,
+            )
+        )
+
+    for svg_file, (code, out, err) in zip(svg_files, results):
+        if out or err:
+            print(f"\n=== {svg_file} ===")
+            _emit(out, err)
+
+    exit_code = max(code for code, _, _ in results)
+    if args.quiet and exit_code == 0:
+        return 0
+
+    # Summary
+    status_names = {0: "OK", 1: "I/O ERROR", 2: "RULE ERROR", 3: "ERRORS"}
+    width = max(len(str(f)) for f in svg_files)
+    print("\n=== Summary ===")
+    for svg_file, (code, _, _) in zip(svg_files, results):
+        print(f"{str(svg_file):<{width}}  {status_names.get(code, str(code))}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
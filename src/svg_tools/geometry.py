@@ -1,13 +1,26 @@
 """Geometry utilities for SVG shape validation and alignment."""
 
+import re
 from dataclasses import dataclass
 from typing import Literal
-from xml.etree import ElementTree as ET
 
-from .utils import SVG_NAMESPACES, get_local_name
+from .utils import ET, SVG_NAMESPACES, get_local_name
 
+# Path data tokens: supported command letters and numbers
+_PATH_TOKEN_RE = re.compile(r'[MmLlHhVvZz]|[-+]?\d*\.?\d+')
 
-@dataclass
+# Qualified (Clark notation) sodipodi arc attribute names
+_SODIPODI_NS = SVG_NAMESPACES["sodipodi"]
+_SODIPODI_TYPE = f"{{{_SODIPODI_NS}}}type"
+_SODIPODI_CX = f"{{{_SODIPODI_NS}}}cx"
+_SODIPODI_CY = f"{{{_SODIPODI_NS}}}cy"
+_SODIPODI_RX = f"{{{_SODIPODI_NS}}}rx"
+_SODIPODI_RY = f"{{{_SODIPODI_NS}}}ry"
+_SODIPODI_START = f"{{{_SODIPODI_NS}}}start"
+_SODIPODI_END = f"{{{_SODIPODI_NS}}}end"
+
+
+@dataclass(slots=True)
 class BoundingBox:
     """Axis-aligned bounding box."""
 
@@ -32,7 +45,7 @@ class BoundingBox:
         return (self.center_x, self.center_y)
 
 
-@dataclass
+@dataclass(slots=True)
 class RectInfo:
     """Information extracted from a rect element."""
 
@@ -51,10 +64,11 @@ class RectInfo:
     @property
     def center(self) -> tuple[float, float]:
         """Center coordinates."""
-        return self.bbox.center
+        # Same arithmetic as bbox.center, without building the BoundingBox
+        return (self.x + self.width / 2, self.y + self.height / 2)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcInfo:
     """Information extracted from an arc (path with sodipodi:type=arc) element."""
 
@@ -88,7 +102,7 @@ class ArcInfo:
         return abs(self.end - self.start)
 
 
-@dataclass
+@dataclass(slots=True)
 class PathInfo:
     """Information extracted from a path element (line segments).
 
@@ -115,7 +129,11 @@ class PathInfo:
     @property
     def center(self) -> tuple[float, float]:
         """Center coordinates."""
-        return self.bbox.center
+        # Same arithmetic as bbox.center, without building the BoundingBox
+        return (
+            min(self.start_x, self.end_x) + abs(self.end_x - self.start_x) / 2,
+            min(self.start_y, self.end_y) + abs(self.end_y - self.start_y) / 2,
+        )
 
     @property
     def is_vertical(self) -> bool:
@@ -169,8 +187,7 @@ def parse_arc(element: ET.Element) -> ArcInfo | None:
     if get_local_name(element.tag) != "path":
         return None
 
-    sodipodi_ns = SVG_NAMESPACES["sodipodi"]
-    arc_type = element.get(f"{{{sodipodi_ns}}}type")
+    arc_type = element.get(_SODIPODI_TYPE)
     if arc_type != "arc":
         return None
 
@@ -178,12 +195,12 @@ def parse_arc(element: ET.Element) -> ArcInfo | None:
         return ArcInfo(
             element=element,
             id=element.get("id", ""),
-            cx=float(element.get(f"{{{sodipodi_ns}}}cx", 0)),
-            cy=float(element.get(f"{{{sodipodi_ns}}}cy", 0)),
-            rx=float(element.get(f"{{{sodipodi_ns}}}rx", 0)),
-            ry=float(element.get(f"{{{sodipodi_ns}}}ry", 0)),
-            start=float(element.get(f"{{{sodipodi_ns}}}start", 0)),
-            end=float(element.get(f"{{{sodipodi_ns}}}end", 0)),
+            cx=float(element.get(_SODIPODI_CX, 0)),
+            cy=float(element.get(_SODIPODI_CY, 0)),
+            rx=float(element.get(_SODIPODI_RX, 0)),
+            ry=float(element.get(_SODIPODI_RY, 0)),
+            start=float(element.get(_SODIPODI_START, 0)),
+            end=float(element.get(_SODIPODI_END, 0)),
         )
     except (ValueError, TypeError):
         return None
@@ -205,8 +222,7 @@ def parse_path(element: ET.Element) -> PathInfo | None:
         return None
 
     # Skip arc elements (handled by parse_arc)
-    sodipodi_ns = SVG_NAMESPACES["sodipodi"]
-    if element.get(f"{{{sodipodi_ns}}}type") == "arc":
+    if element.get(_SODIPODI_TYPE) == "arc":
         return None
 
     d = element.get("d", "")
@@ -230,8 +246,7 @@ def _parse_path_d(element: ET.Element, d: str) -> PathInfo | None:
         PathInfo or None if parsing fails.
     """
     # Tokenize: split on command letters while keeping them
-    import re
-    tokens = re.findall(r'[MmLlHhVvZz]|[-+]?\d*\.?\d+', d)
+    tokens = _PATH_TOKEN_RE.findall(d)
 
     if not tokens:
         return None
@@ -491,20 +506,18 @@ def update_arc(
         start: New start angle (or None to keep current).
         end: New end angle (or None to keep current).
     """
-    sodipodi_ns = SVG_NAMESPACES["sodipodi"]
-
     if cx is not None:
-        element.set(f"{{{sodipodi_ns}}}cx", str(cx))
+        element.set(_SODIPODI_CX, str(cx))
     if cy is not None:
-        element.set(f"{{{sodipodi_ns}}}cy", str(cy))
+        element.set(_SODIPODI_CY, str(cy))
     if rx is not None:
-        element.set(f"{{{sodipodi_ns}}}rx", str(rx))
+        element.set(_SODIPODI_RX, str(rx))
     if ry is not None:
-        element.set(f"{{{sodipodi_ns}}}ry", str(ry))
+        element.set(_SODIPODI_RY, str(ry))
     if start is not None:
-        element.set(f"{{{sodipodi_ns}}}start", str(start))
+        element.set(_SODIPODI_START, str(start))
     if end is not None:
-        element.set(f"{{{sodipodi_ns}}}end", str(end))
+        element.set(_SODIPODI_END, str(end))
 
 
 def update_path(
@@ -517,6 +530,7 @@ def update_path(
     """Update path element d attribute with new start/end points.
 
     Reconstructs the path d attribute based on the line type (H, V, or L).
+    When all four values are given, the current d attribute is not parsed.
 
     Args:
         element: SVG path element.
@@ -525,16 +539,24 @@ def update_path(
         end_x: New end x (or None to keep current).
         end_y: New end y (or None to keep current).
     """
-    # Parse current path to get existing values
-    info = parse_path(element)
-    if info is None:
-        return
-
-    # Apply new values
-    sx = start_x if start_x is not None else info.start_x
-    sy = start_y if start_y is not None else info.start_y
-    ex = end_x if end_x is not None else info.end_x
-    ey = end_y if end_y is not None else info.end_y
+    if (
+        start_x is not None
+        and start_y is not None
+        and end_x is not None
+        and end_y is not None
+    ):
+        sx, sy, ex, ey = start_x, start_y, end_x, end_y
+    else:
+        # Parse current path to get existing values
+        info = parse_path(element)
+        if info is None:
+            return
+
+        # Apply new values
+        sx = start_x if start_x is not None else info.start_x
+        sy = start_y if start_y is not None else info.start_y
+        ex = end_x if end_x is not None else info.end_x
+        ey = end_y if end_y is not None else info.end_y
 
     # Determine path type and construct d attribute
     if abs(sx - ex) < 0.001:
@@ -11,17 +11,14 @@ The pipeline processes in order: align -> relabel -> add_text
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
-from xml.etree import ElementTree as ET
-
-import yaml
 
 from .add_text import (
     AddTextReport,
     AddTextRule,
     TextLineRule,
-    FontConfig,
-    TextFormatConfig,
     add_text_to_svg_tree,
+    parse_font_config,
+    parse_text_format_config,
 )
 from .align import (
     AlignmentReport,
@@ -46,7 +43,7 @@ from .relabel import (
     relabel_svg_tree,
 )
 from .strip import StripReport, StripRule, _parse_strip_section, strip_svg_tree
-from .utils import register_namespaces
+from .utils import ET, load_svg, load_yaml
 
 
 # Step names
@@ -295,29 +292,9 @@ def parse_add_text_section(data: dict) -> AddTextRule:
                 f"Group '{group_data['name']}': Must specify layout fields"
             )
 
-        # Font (optional)
-        font = FontConfig()
-        if "font" in group_data:
-            font_data = group_data["font"]
-            if "family" in font_data:
-                font.family = str(font_data["family"])
-            if "size" in font_data:
-                font.size = float(font_data["size"])
-            if "color" in font_data:
-                font.color = str(font_data["color"])
-
-        # Format (optional)
-        fmt = TextFormatConfig()
-        if "format" in group_data:
-            fmt_data = group_data["format"]
-            if "type" in fmt_data:
-                fmt.type = fmt_data["type"]
-            if "padding" in fmt_data:
-                fmt.padding = int(fmt_data["padding"])
-            if "start" in fmt_data:
-                fmt.start = int(fmt_data["start"])
-            if "custom" in fmt_data:
-                fmt.custom = [str(item) for item in fmt_data["custom"]]
+        # Font and format (optional)
+        font = parse_font_config(group_data.get("font"))
+        fmt = parse_text_format_config(group_data.get("format"))
 
         # Align (optional)
         align = group_data.get("align", "bbox_center")
@@ -369,8 +346,7 @@ def parse_process_rule_file(rule_path: Path) -> ProcessRule:
         yaml.YAMLError: If the file is not valid YAML.
         ValueError: If the rule format is invalid.
     """
-    with open(rule_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = load_yaml(rule_path)
 
     if not isinstance(data, dict):
         raise ValueError("Rule file must be a YAML dictionary")
@@ -478,18 +454,19 @@ def process_svg(
     Returns:
         Tuple of (ElementTree, ProcessReport).
     """
-    register_namespaces()
-    tree = ET.parse(svg_path)
+    tree = load_svg(svg_path)
     report = process_svg_tree(tree, rule, steps, apply)
     report.file_path = svg_path
     return tree, report
 
 
-def format_process_report(report: ProcessReport) -> str:
+def format_process_report(report: ProcessReport, summary_only: bool = False) -> str:
     """Format processing report as text.
 
     Args:
         report: Processing report.
+        summary_only: If True, list only aligned elements with errors (skip
+            fixable ones).
 
     Returns:
         Formatted text.
@@ -541,7 +518,7 @@ def format_process_report(report: ProcessReport) -> str:
             )
 
             for elem_result in group_result.element_results:
-                if not elem_result.is_ok:
+                if elem_result.has_errors or (not summary_only and not elem_result.is_ok):
                     status_str = "ERROR" if elem_result.has_errors else "FIXABLE"
                     lines.append(f"  [{status_str}] {elem_result.element_id}")
                     for issue in elem_result.issues:
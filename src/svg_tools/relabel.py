@@ -3,9 +3,6 @@
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterator, Literal
-from xml.etree import ElementTree as ET
-
-import yaml
 
 from .geometry import (
     ShapeInfo,
@@ -14,9 +11,12 @@ from .geometry import (
     parse_rect,
 )
 from .utils import (
+    ET,
     find_all_groups_by_label,
     get_element_label,
-    register_namespaces,
+    index_groups_by_label,
+    load_svg,
+    load_yaml,
     set_element_label,
 )
 
@@ -262,8 +262,7 @@ def parse_relabel_rule_file(rule_path: Path) -> RelabelRule:
         yaml.YAMLError: If the file is not valid YAML.
         ValueError: If the rule format is invalid.
     """
-    with open(rule_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = load_yaml(rule_path)
 
     if not isinstance(data, dict):
         raise ValueError("Rule file must be a YAML dictionary")
@@ -522,30 +521,27 @@ def sort_shapes(
     if sort_config.by == "none":
         return shapes
 
-    x_reverse = sort_config.x_order == "descending"
-    y_reverse = sort_config.y_order == "descending"
+    # Signs applied to the center coordinates; each key reads s.center once
+    x_sign = -1 if sort_config.x_order == "descending" else 1
+    y_sign = -1 if sort_config.y_order == "descending" else 1
 
     if sort_config.by == "x_then_y":
         # Sort by X first, then by Y for same X values
-        return sorted(
-            shapes,
-            key=lambda s: (
-                s.center[0] if not x_reverse else -s.center[0],
-                s.center[1] if not y_reverse else -s.center[1],
-            ),
-        )
+        def sort_key(s: ShapeInfo) -> tuple[float, float]:
+            center_x, center_y = s.center
+            return (center_x * x_sign, center_y * y_sign)
+
     elif sort_config.by == "y_then_x":
         # Sort by Y first, then by X for same Y values
-        return sorted(
-            shapes,
-            key=lambda s: (
-                s.center[1] if not y_reverse else -s.center[1],
-                s.center[0] if not x_reverse else -s.center[0],
-            ),
-        )
+        def sort_key(s: ShapeInfo) -> tuple[float, float]:
+            center_x, center_y = s.center
+            return (center_y * y_sign, center_x * x_sign)
+
     else:
         return shapes
 
+    return sorted(shapes, key=sort_key)
+
 
 def reorder_elements_in_group(
     group: ET.Element,
@@ -615,6 +611,7 @@ def relabel_group(
     root: ET.Element,
     rule: RelabelGroupRule,
     apply: bool = False,
+    groups: list[ET.Element] | None = None,
 ) -> GroupRelabelResult:
     """Relabel shapes in a group.
 
@@ -622,11 +619,14 @@ def relabel_group(
         root: Root SVG element.
         rule: Group relabel rule.
         apply: Whether to apply changes to the SVG.
+        groups: Groups matching rule.name, if already resolved (e.g. from
+            index_groups_by_label). Looked up in root when None.
 
     Returns:
         GroupRelabelResult with changes and any warnings/errors.
     """
-    groups = find_all_groups_by_label(root, rule.name)
+    if groups is None:
+        groups = find_all_groups_by_label(root, rule.name)
 
     # Initialize result with default origin
     result = GroupRelabelResult(
@@ -776,8 +776,13 @@ def relabel_svg_tree(
     root = tree.getroot()
     report = RelabelReport(file_path=Path(""))
 
+    # Resolve every rule's groups with one tree walk. Relabeling only
+    # touches shape labels, so the group index stays valid throughout.
+    group_index = index_groups_by_label(root)
     for group_rule in rule.groups:
-        group_result = relabel_group(root, group_rule, apply=apply)
+        group_result = relabel_group(
+            root, group_rule, apply=apply, groups=group_index.get(group_rule.name, [])
+        )
         report.group_results.append(group_result)
 
     return report
@@ -798,18 +803,18 @@ def relabel_svg(
     Returns:
         Tuple of (ElementTree, RelabelReport).
     """
-    register_namespaces()
-    tree = ET.parse(svg_path)
+    tree = load_svg(svg_path)
     report = relabel_svg_tree(tree, rule, apply)
     report.file_path = svg_path
     return tree, report
 
 
-def format_relabel_report(report: RelabelReport) -> str:
+def format_relabel_report(report: RelabelReport, summary_only: bool = False) -> str:
     """Format relabel report as text.
 
     Args:
         report: Relabel report.
+        summary_only: If True, omit the per-element label change listing.
 
     Returns:
         Formatted text.
@@ -846,7 +851,7 @@ def format_relabel_report(report: RelabelReport) -> str:
             lines.append("")
 
         # Label changes
-        if group_result.changes:
+        if group_result.changes and not summary_only:
             lines.append("  Label changes:")
             for change in group_result.changes:
                 old = change.old_label if change.old_label else "(none)"
@@ -7,11 +7,8 @@ exact match and Inkscape duplicate suffixes (e.g., "_ref", "_ref 1").
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
-import yaml
-
-from .utils import find_all_groups_by_label, register_namespaces
+from .utils import ET, find_all_groups_by_label, load_svg, load_yaml
 
 
 @dataclass
@@ -60,8 +57,7 @@ def parse_strip_rule_file(rule_path: Path) -> StripRule:
         yaml.YAMLError: If the file is not valid YAML.
         ValueError: If the rule format is invalid.
     """
-    with open(rule_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = load_yaml(rule_path)
 
     if not isinstance(data, dict):
         raise ValueError("Rule file must be a YAML dictionary")
@@ -129,8 +125,7 @@ def strip_svg(
     Returns:
         Tuple of (modified ElementTree, StripReport).
     """
-    register_namespaces()
-    tree = ET.parse(svg_path)
+    tree = load_svg(svg_path)
     report = strip_svg_tree(tree, rule)
     return tree, report
 
@@ -2,17 +2,43 @@
 
 import re
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import Iterator
-from xml.etree import ElementTree as ET
+from types import MappingProxyType
+from typing import Any, Iterator
+
+import yaml
+
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Prefer lxml (libxml2 parser/serializer) and fall back to the stdlib
+# ElementTree. Both expose the same Element/SubElement/parse/ElementTree API.
+try:
+    from lxml import etree as ET
+except ImportError:
+    from xml.etree import ElementTree as ET
+
+# True when the lxml backend is active
+USING_LXML = ET.__name__ == "lxml.etree"
+
+# SVG namespace mappings (read-only: qualified-name constants below and in
+# other modules are derived from it at import time)
+SVG_NAMESPACES = MappingProxyType(
+    {
+        "svg": "http://www.w3.org/2000/svg",
+        "inkscape": "http://www.inkscape.org/namespaces/inkscape",
+        "sodipodi": "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+        "xlink": "http://www.w3.org/1999/xlink",
+    }
+)
 
-# SVG namespace mappings
-SVG_NAMESPACES = {
-    "svg": "http://www.w3.org/2000/svg",
-    "inkscape": "http://www.inkscape.org/namespaces/inkscape",
-    "sodipodi": "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
-    "xlink": "http://www.w3.org/1999/xlink",
-}
+# Qualified (Clark notation) names for SVG groups and their labels
+SVG_G_TAG = f"{{{SVG_NAMESPACES['svg']}}}g"
+INKSCAPE_LABEL = f"{{{SVG_NAMESPACES['inkscape']}}}label"
 
 # Drawing elements to count
 DRAWING_ELEMENTS = frozenset(
@@ -32,12 +58,58 @@ DRAWING_ELEMENTS = frozenset(
 )
 
 
+@cache
 def register_namespaces() -> None:
-    """Register SVG namespaces to preserve prefixes when writing."""
+    """Register SVG namespaces to preserve prefixes when writing.
+
+    The registration is global and only performed on the first call.
+    """
     for prefix, uri in SVG_NAMESPACES.items():
         ET.register_namespace(prefix, uri)
 
 
+def load_svg(file_path: Path) -> ET.ElementTree:
+    """Parse an SVG file into an ElementTree.
+
+    Args:
+        file_path: Path to the SVG file.
+
+    Returns:
+        Parsed ElementTree.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ET.ParseError: If the file is not valid XML.
+    """
+    register_namespaces()
+    # Open the file ourselves so both backends raise FileNotFoundError
+    with open(file_path, "rb") as f:
+        if USING_LXML:
+            # Lift libxml2's ~10 MB node limit (embedded base64 images), as
+            # the stdlib parser has no such limit
+            return ET.parse(f, ET.XMLParser(huge_tree=True))
+        return ET.parse(f)
+
+
+def load_yaml(file_path: Path) -> Any:
+    """Load a YAML file with the safe loader (C-accelerated when available).
+
+    Args:
+        file_path: Path to the YAML file.
+
+    Returns:
+        Parsed YAML data.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    # Hand libyaml the raw bytes; it detects the encoding (UTF-8 or a BOM)
+    # itself, so no Python-side decode pass is needed
+    with open(file_path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def parse_svg(file_path: Path) -> ET.Element:
     """Parse an SVG file and return the root element.
 
@@ -51,9 +123,21 @@ def parse_svg(file_path: Path) -> ET.Element:
         FileNotFoundError: If the file does not exist.
         ET.ParseError: If the file is not valid XML.
     """
-    register_namespaces()
-    tree = ET.parse(file_path)
-    return tree.getroot()
+    return load_svg(file_path).getroot()
+
+
+def write_svg(tree: ET.ElementTree, file_path: Path) -> None:
+    """Write an ElementTree to an SVG file as UTF-8 with an XML declaration.
+
+    The serialized bytes are streamed into a large write buffer instead of
+    being built up as one in-memory string first.
+
+    Args:
+        tree: ElementTree to serialize.
+        file_path: Output file path.
+    """
+    with open(file_path, "wb", buffering=1 << 20) as f:
+        tree.write(f, encoding="utf-8", xml_declaration=True)
 
 
 def get_local_name(tag: str) -> str:
@@ -69,11 +153,35 @@ def get_local_name(tag: str) -> str:
         >>> get_local_name("{http://www.w3.org/2000/svg}rect")
         'rect'
     """
+    if not isinstance(tag, str):
+        # Comments and processing instructions (lxml) have non-string tags
+        return ""
     if tag.startswith("{"):
         return tag.split("}", 1)[1]
     return tag
 
 
+def iter_by_local_name(root: ET.Element, local_name: str) -> Iterator[ET.Element]:
+    """Iterate over elements with a local name, in any namespace or none.
+
+    Equivalent to filtering root.iter() with get_local_name(), but with
+    lxml the match runs in C through the "{*}name" wildcard.
+
+    Args:
+        root: Element to search (included in the iteration).
+        local_name: Local tag name to match.
+
+    Yields:
+        Matching elements in document order.
+    """
+    if USING_LXML:
+        yield from root.iter(f"{{*}}{local_name}")
+        return
+    for elem in root.iter():
+        if get_local_name(elem.tag) == local_name:
+            yield elem
+
+
 def get_group_name(element: ET.Element) -> str | None:
     """Get the display name for a group element.
 
@@ -90,7 +198,7 @@ def get_group_name(element: ET.Element) -> str | None:
         return None
 
     # Try inkscape:label first
-    label = element.get(f"{{{SVG_NAMESPACES['inkscape']}}}label")
+    label = element.get(INKSCAPE_LABEL)
     if label:
         return label
 
@@ -201,6 +309,9 @@ def collect_group_stats(element: ET.Element, depth: int = 0) -> GroupStats | Non
                 # Anonymous group - collect its elements into parent
                 _collect_anonymous_group(child, stats)
 
+    # Store counts sorted by element type so consumers need not re-sort
+    stats.element_counts = dict(sorted(stats.element_counts.items()))
+
     return stats
 
 
@@ -246,6 +357,9 @@ def analyze_svg(file_path: Path) -> SVGStats:
                 # Anonymous root group - collect as ungrouped
                 _collect_ungrouped(child, stats)
 
+    # Store counts sorted by element type so consumers need not re-sort
+    stats.ungrouped_counts = dict(sorted(stats.ungrouped_counts.items()))
+
     return stats
 
 
@@ -274,17 +388,16 @@ def iter_all_groups(stats: SVGStats) -> Iterator[GroupStats]:
     Yields:
         Each GroupStats in the hierarchy.
     """
-
-    def _iter_group(group: GroupStats) -> Iterator[GroupStats]:
+    # Explicit stack (children pushed in reverse to keep pre-order) avoids
+    # a chain of nested generators on deeply nested documents
+    stack = list(reversed(stats.root_groups))
+    while stack:
+        group = stack.pop()
         yield group
-        for child in group.children:
-            yield from _iter_group(child)
+        stack.extend(reversed(group.children))
 
-    for root_group in stats.root_groups:
-        yield from _iter_group(root_group)
 
-
-def find_group_by_label(root: ET.Element, label: str) -> ET.Element | None:
+def find_group_by_label(root: ET.Element, label: str) -> "ET.Element | None":
     """Find a group element by inkscape:label.
 
     Args:
@@ -294,12 +407,9 @@ def find_group_by_label(root: ET.Element, label: str) -> ET.Element | None:
     Returns:
         Group element or None if not found.
     """
-    inkscape_ns = SVG_NAMESPACES["inkscape"]
-    for elem in root.iter():
-        if get_local_name(elem.tag) == "g":
-            elem_label = elem.get(f"{{{inkscape_ns}}}label")
-            if elem_label == label:
-                return elem
+    for elem in iter_by_local_name(root, "g"):
+        if elem.get(INKSCAPE_LABEL) == label:
+            return elem
     return None
 
 
@@ -316,17 +426,45 @@ def find_all_groups_by_label(root: ET.Element, label: str) -> list[ET.Element]:
     Returns:
         List of matching group elements in document order.
     """
-    inkscape_ns = SVG_NAMESPACES["inkscape"]
     pattern = re.compile(r"^" + re.escape(label) + r"(?: \d+)?$")
     result = []
-    for elem in root.iter():
-        if get_local_name(elem.tag) == "g":
-            elem_label = elem.get(f"{{{inkscape_ns}}}label")
-            if elem_label and pattern.match(elem_label):
-                result.append(elem)
+    for elem in iter_by_local_name(root, "g"):
+        elem_label = elem.get(INKSCAPE_LABEL)
+        if elem_label and pattern.match(elem_label):
+            result.append(elem)
     return result
 
 
+# Inkscape duplicate naming: "label N"
+_DUPLICATE_LABEL_RE = re.compile(r"^(.*) \d+$")
+
+
+def index_groups_by_label(root: ET.Element) -> dict[str, list[ET.Element]]:
+    """Index all groups by inkscape:label in a single tree walk.
+
+    Each group is listed under its own label and, when the label follows
+    the Inkscape duplicate pattern "label N", also under the base label.
+    index.get(label, []) therefore matches find_all_groups_by_label(root,
+    label), without walking the tree once per label.
+
+    Args:
+        root: Root SVG element.
+
+    Returns:
+        Mapping of label to matching group elements in document order.
+    """
+    index: dict[str, list[ET.Element]] = {}
+    for elem in iter_by_local_name(root, "g"):
+        label = elem.get(INKSCAPE_LABEL)
+        if not label:
+            continue
+        index.setdefault(label, []).append(elem)
+        duplicate = _DUPLICATE_LABEL_RE.match(label)
+        if duplicate:
+            index.setdefault(duplicate.group(1), []).append(elem)
+    return index
+
+
 def get_element_label(element: ET.Element) -> str | None:
     """Get the inkscape:label of an element.
 
@@ -336,8 +474,7 @@ def get_element_label(element: ET.Element) -> str | None:
     Returns:
         The label value or None if not set.
     """
-    inkscape_ns = SVG_NAMESPACES["inkscape"]
-    return element.get(f"{{{inkscape_ns}}}label")
+    return element.get(INKSCAPE_LABEL)
 
 
 def set_element_label(element: ET.Element, label: str) -> None:
@@ -347,5 +484,4 @@ def set_element_label(element: ET.Element, label: str) -> None:
         element: An XML element.
         label: The label value to set.
     """
-    inkscape_ns = SVG_NAMESPACES["inkscape"]
-    element.set(f"{{{inkscape_ns}}}label", label)
+    element.set(INKSCAPE_LABEL, label)
@@ -1,13 +1,15 @@
 """Tests for svg_tools.add_text module."""
 
+import json
+import os
+import freetype
 import pytest
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from svg_tools.utils import SVG_NAMESPACES
+from svg_tools.utils import ET, SVG_NAMESPACES, write_svg
 from svg_tools.add_text import (
     AlignType,
     FontConfig,
@@ -17,14 +19,25 @@ from svg_tools.add_text import (
     TextElementInfo,
     GroupAddResult,
     AddTextReport,
+    MEASURE_FONT_SIZE_PT,
     calculate_text_offset_estimated,
     calculate_text_offset_freetype,
+    calculate_text_offsets,
     create_text_element,
+    get_text_extents_freetype,
+    find_font_file,
+    load_font_face,
+    get_face,
     generate_grid_positions,
     generate_text_label,
+    generate_text_labels,
     create_text_group,
+    build_text_group_xml,
     parse_add_text_rule_file,
+    parse_font_config,
+    parse_text_format_config,
     add_text_to_svg,
+    splice_text_to_svg,
     format_add_text_report,
 )
 
@@ -68,6 +81,31 @@ class TestTextFormatConfig:
         assert config.custom == ["x", "y", "z"]
 
 
+class TestParseConfigSections:
+    """Tests for parse_font_config and parse_text_format_config."""
+
+    def test_omitted_sections_use_defaults(self):
+        assert parse_font_config(None) == FontConfig()
+        assert parse_text_format_config(None) == TextFormatConfig()
+
+    def test_font_fields_are_converted(self):
+        font = parse_font_config({"family": "DejaVu Sans", "size": 2, "color": "#f00"})
+        assert font == FontConfig(family="DejaVu Sans", size=2.0, color="#f00")
+        assert isinstance(font.size, float)
+
+    def test_format_fields_are_converted(self):
+        fmt = parse_text_format_config({"type": "custom", "padding": "2", "custom": [1, "b"]})
+        assert fmt == TextFormatConfig(type="custom", padding=2, start=1, custom=["1", "b"])
+
+    def test_invalid_format_type(self):
+        with pytest.raises(ValueError, match="Invalid format.type value"):
+            parse_text_format_config({"type": "roman"})
+
+    def test_custom_must_be_list(self):
+        with pytest.raises(ValueError, match="must be a list"):
+            parse_text_format_config({"type": "custom", "custom": "abc"})
+
+
 class TestTextLineRule:
     """Tests for TextLineRule dataclass."""
 
@@ -155,10 +193,28 @@ class TestTextLineRule:
         )
         assert rule.align == "baseline_center"
 
+    def test_default_uniform_width(self):
+        """Test uniform_width is off by default."""
+        rule = TextLineRule(
+            name="labels",
+            y=2.54,
+            x_start=5.08,
+            x_end=20.32,
+            x_interval=2.54,
+        )
+        assert rule.uniform_width is False
+
 
 class TestGroupAddResult:
     """Tests for GroupAddResult dataclass."""
 
+    def test_per_element_records_are_slotted(self):
+        """Records created once per label carry no instance __dict__."""
+        info = TextElementInfo("t-1", "1", 0.0, 0.0, 0.1, 0.2)
+        assert not hasattr(info, "__dict__")
+        with pytest.raises(AttributeError):
+            info.extra = 1
+
     def test_empty_horizontal_result(self):
         """Test empty horizontal layout result."""
         result = GroupAddResult(
@@ -328,6 +384,310 @@ class TestCalculateTextOffset:
         assert offset_y == pytest.approx(3.75)
 
 
+class TestCalculateTextOffsetFreetype:
+    """Tests for calculate_text_offset_freetype function."""
+
+    def test_repeated_calls_consistent(self):
+        first = calculate_text_offset_freetype("Arial", 1.27, "12")
+        second = calculate_text_offset_freetype("Arial", 1.27, "12")
+        assert first == second
+
+    def test_size_float_noise_ignored(self):
+        # Sizes differing only by float noise give the same (cached) result
+        a = calculate_text_offset_freetype("Arial", 0.1 + 0.2, "1")
+        b = calculate_text_offset_freetype("Arial", 0.3, "1")
+        assert a == b
+
+    def test_baseline_center_y_zero(self):
+        _, offset_y = calculate_text_offset_freetype(
+            "Arial", 1.27, "1", align="baseline_center"
+        )
+        assert offset_y == 0
+
+    def test_batch_matches_single(self):
+        offsets = calculate_text_offsets("Arial", 1.27, ["1", "12", "1", "a"])
+
+        assert list(offsets) == ["1", "12", "a"]
+        for text, offset in offsets.items():
+            assert offset == calculate_text_offset_freetype("Arial", 1.27, text)
+
+    def test_batch_resolves_font_once(self, monkeypatch):
+        from svg_tools import add_text
+
+        calls = []
+
+        def counting_find_font_file(font_family):
+            calls.append(font_family)
+            return None
+
+        monkeypatch.setattr(add_text, "find_font_file", counting_find_font_file)
+        offsets = calculate_text_offsets("Arial", 1.27, ["1", "2", "3"])
+
+        assert calls == ["Arial"]
+        assert offsets["1"] == calculate_text_offset_estimated(1.27, "1")
+
+
+# Font used for FreeType measurement tests (skipped when not installed)
+DEJAVU_SANS = Path("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf")
+
+
+@pytest.mark.skipif(not DEJAVU_SANS.exists(), reason="DejaVu Sans not installed")
+class TestGetFace:
+    """Tests for get_face function."""
+
+    def test_returns_cached_face(self):
+        face = get_face("DejaVu Sans")
+        assert isinstance(face, freetype.Face)
+        assert get_face("DejaVu Sans") is face
+
+    def test_replaced_font_file_is_reloaded(self, tmp_path, monkeypatch):
+        from svg_tools import add_text
+
+        font_path = tmp_path / "font.ttf"
+        font_path.write_bytes(DEJAVU_SANS.read_bytes())
+        monkeypatch.setattr(add_text, "find_font_file", lambda family: str(font_path))
+        first = get_face("Replaced Family")
+        offset = calculate_text_offset_freetype("Replaced Family", 1.27, "1")
+
+        # Simulate the file being replaced by bumping its mtime
+        st = font_path.stat()
+        os.utime(font_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        second = get_face("Replaced Family")
+        assert second is not first
+        # Same font content, measured again through the new face
+        assert calculate_text_offset_freetype("Replaced Family", 1.27, "1") == offset
+
+
+@pytest.mark.skipif(not DEJAVU_SANS.exists(), reason="DejaVu Sans not installed")
+class TestPrewarmGlyphs:
+    """Tests for _prewarm_glyphs function."""
+
+    def test_loads_label_charset(self):
+        from svg_tools import add_text
+
+        rule = AddTextRule(
+            groups=[
+                TextLineRule(
+                    name="n", font=FontConfig(family="DejaVu Sans"),
+                    y=0.0, x_start=0.0, x_end=2.54, x_interval=2.54,
+                ),
+                TextLineRule(
+                    name="c", font=FontConfig(family="DejaVu Sans"),
+                    format=TextFormatConfig(type="custom", custom=["α", "pl"]),
+                    y=0.0, x_start=0.0, x_end=2.54, x_interval=2.54,
+                ),
+            ]
+        )
+        add_text._prewarm_glyphs(rule)
+
+        face = get_face("DejaVu Sans")
+        char_size = MEASURE_FONT_SIZE_PT * 64
+        glyphs = add_text._glyph_metrics_cache[face][(char_size, 96)]
+        assert set("0123456789αpl") <= set(glyphs)
+
+    def test_prewarmed_extents_match(self):
+        from svg_tools import add_text
+
+        rule = AddTextRule(
+            groups=[
+                TextLineRule(
+                    name="n", font=FontConfig(family="DejaVu Sans"),
+                    y=0.0, x_start=0.0, x_end=2.54, x_interval=2.54,
+                )
+            ]
+        )
+        add_text._prewarm_glyphs(rule)
+        warm_face = get_face("DejaVu Sans")
+        cold_face = freetype.Face(str(DEJAVU_SANS))
+
+        warm = get_text_extents_freetype(warm_face, "109", MEASURE_FONT_SIZE_PT)
+        cold = get_text_extents_freetype(cold_face, "109", MEASURE_FONT_SIZE_PT)
+        assert warm == cold
+
+
+@pytest.mark.skipif(not DEJAVU_SANS.exists(), reason="DejaVu Sans not installed")
+class TestFindFontFile:
+    """Tests for find_font_file function."""
+
+    def test_finds_installed_family(self):
+        path = find_font_file("DejaVu Sans")
+        if path is None:
+            pytest.skip("fontconfig not available")
+        assert Path(path).exists()
+
+    def test_result_is_cached(self):
+        assert find_font_file("DejaVu Sans") is find_font_file("DejaVu Sans")
+
+
+class TestFontPathDiskCache:
+    """Tests for the persistent font lookup cache used by find_font_file."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path, monkeypatch):
+        """Point the cache at a temporary directory and reset in-memory caches."""
+        from svg_tools import add_text
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        find_font_file.cache_clear()
+        add_text._disk_font_cache.cache_clear()
+        yield tmp_path / "svg_tools" / "font_paths.json"
+        find_font_file.cache_clear()
+        add_text._disk_font_cache.cache_clear()
+
+    def _write_cache(self, cache_file, paths, stamp=None):
+        from svg_tools import add_text
+
+        cache_file.parent.mkdir(parents=True)
+        if stamp is None:
+            stamp = add_text._font_dirs_stamp()
+        cache_file.write_text(
+            json.dumps(
+                {
+                    "version": add_text._FONT_CACHE_VERSION,
+                    "stamp": stamp,
+                    "paths": paths,
+                }
+            )
+        )
+
+    def test_cached_path_used(self, isolated_cache, tmp_path):
+        font = tmp_path / "fake.ttf"
+        font.write_bytes(b"")
+        self._write_cache(isolated_cache, {"Fake Family": str(font)})
+
+        assert find_font_file("Fake Family") == str(font)
+
+    def test_stale_stamp_ignored(self, isolated_cache, tmp_path):
+        font = tmp_path / "fake.ttf"
+        font.write_bytes(b"")
+        self._write_cache(
+            isolated_cache, {"Fake Family": str(font)}, stamp={"/nonexistent": 0}
+        )
+
+        assert find_font_file("Fake Family") != str(font)
+
+    def test_missing_file_looked_up_again(self, isolated_cache, tmp_path):
+        self._write_cache(isolated_cache, {"Fake Family": str(tmp_path / "gone.ttf")})
+
+        assert find_font_file("Fake Family") != str(tmp_path / "gone.ttf")
+
+    def test_lookup_written_to_cache(self, isolated_cache):
+        path = find_font_file("DejaVu Sans")
+        if path is None:
+            pytest.skip("fontconfig not available")
+
+        data = json.loads(isolated_cache.read_text())
+        assert data["paths"]["DejaVu Sans"] == path
+
+    def test_old_format_ignored(self, isolated_cache, tmp_path):
+        from svg_tools import add_text
+
+        font = tmp_path / "fake.ttf"
+        font.write_bytes(b"")
+        isolated_cache.parent.mkdir(parents=True)
+        isolated_cache.write_text(
+            json.dumps(
+                {
+                    "stamp": add_text._font_dirs_stamp(),
+                    "paths": {"Fake Family": str(font)},
+                }
+            )
+        )
+
+        assert find_font_file("Fake Family") != str(font)
+
+    def test_fallback_substitute_not_written(self, isolated_cache, monkeypatch):
+        from svg_tools import add_text
+
+        monkeypatch.setattr(
+            add_text,
+            "_match_font_file",
+            lambda family: ("/fonts/DejaVuSans.ttf", ("DejaVu Sans",)),
+        )
+
+        assert find_font_file("Missing Family") == "/fonts/DejaVuSans.ttf"
+        assert not isolated_cache.exists()
+
+    def test_exact_match_written(self, isolated_cache, monkeypatch):
+        from svg_tools import add_text
+
+        monkeypatch.setattr(
+            add_text,
+            "_match_font_file",
+            lambda family: ("/fonts/Noto.ttc", ("Noto Sans CJK JP", "Noto Sans CJK")),
+        )
+
+        assert find_font_file("noto sans cjk jp:style=Bold") == "/fonts/Noto.ttc"
+        data = json.loads(isolated_cache.read_text())
+        assert data["paths"] == {"noto sans cjk jp:style=Bold": "/fonts/Noto.ttc"}
+
+
+@pytest.mark.skipif(not DEJAVU_SANS.exists(), reason="DejaVu Sans not installed")
+class TestLoadFontFace:
+    """Tests for load_font_face function."""
+
+    def test_same_file_reuses_face(self):
+        assert load_font_face(str(DEJAVU_SANS)) is load_font_face(str(DEJAVU_SANS))
+
+    def test_replaced_file_is_reloaded(self, tmp_path):
+        font_path = tmp_path / "font.ttf"
+        font_path.write_bytes(DEJAVU_SANS.read_bytes())
+        first = load_font_face(str(font_path))
+
+        # Simulate the file being replaced by bumping its mtime
+        st = font_path.stat()
+        os.utime(font_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_font_face(str(font_path)) is not first
+
+
+@pytest.mark.skipif(not DEJAVU_SANS.exists(), reason="DejaVu Sans not installed")
+class TestGetTextExtentsFreetype:
+    """Tests for get_text_extents_freetype function."""
+
+    def test_repeated_glyphs_match_fresh_face(self):
+        face = load_font_face(str(DEJAVU_SANS))
+        cached = get_text_extents_freetype(face, "1212", MEASURE_FONT_SIZE_PT)
+
+        # A new face has no cached glyph metrics
+        fresh = freetype.Face(str(DEJAVU_SANS))
+        assert get_text_extents_freetype(fresh, "1212", MEASURE_FONT_SIZE_PT) == cached
+
+    def test_advance_is_sum_of_glyphs(self):
+        face = load_font_face(str(DEJAVU_SANS))
+        one = get_text_extents_freetype(face, "1", MEASURE_FONT_SIZE_PT)
+        two = get_text_extents_freetype(face, "12", MEASURE_FONT_SIZE_PT)
+        ones = get_text_extents_freetype(face, "11", MEASURE_FONT_SIZE_PT)
+
+        assert ones.x_advance == 2 * one.x_advance
+        assert two.x_bearing == one.x_bearing
+        assert two.width > one.width
+
+    def test_whitespace_only(self):
+        face = load_font_face(str(DEJAVU_SANS))
+        extents = get_text_extents_freetype(face, " ", MEASURE_FONT_SIZE_PT)
+
+        assert extents.width == 0
+        assert extents.height == 0
+        assert extents.x_advance > 0
+
+    def test_sizes_cached_separately(self):
+        face = load_font_face(str(DEJAVU_SANS))
+        large = get_text_extents_freetype(face, "8", MEASURE_FONT_SIZE_PT)
+        small = get_text_extents_freetype(face, "8", MEASURE_FONT_SIZE_PT / 2)
+
+        assert small.x_advance < large.x_advance
+
+    def test_new_glyph_after_size_change(self):
+        face = load_font_face(str(DEJAVU_SANS))
+        get_text_extents_freetype(face, "8", MEASURE_FONT_SIZE_PT)
+        get_text_extents_freetype(face, "8", MEASURE_FONT_SIZE_PT / 2)
+
+        # The face must be resized back before loading an unseen glyph
+        extents = get_text_extents_freetype(face, "Q", MEASURE_FONT_SIZE_PT)
+        fresh = freetype.Face(str(DEJAVU_SANS))
+        assert extents == get_text_extents_freetype(fresh, "Q", MEASURE_FONT_SIZE_PT)
+
+
 class TestGenerateGridPositions:
     """Tests for generate_grid_positions function."""
 
@@ -352,6 +712,22 @@ class TestGenerateGridPositions:
         assert positions[1] == pytest.approx(2.54)
         assert positions[2] == pytest.approx(5.08)
 
+    def test_end_before_start(self):
+        positions = generate_grid_positions(10.16, 5.08, 2.54)
+        assert positions == []
+
+    def test_no_accumulated_drift(self):
+        # Each position is derived from its index, not by repeated addition
+        positions = generate_grid_positions(0.0, 1000 * 0.254, 0.254)
+        assert len(positions) == 1001
+        assert positions == [i * 0.254 for i in range(1001)]
+
+    def test_long_range_keeps_final_position(self):
+        # Repeated addition used to drift past the end tolerance on long rows
+        positions = generate_grid_positions(1.27, 1.27 + 2.54 * 2000, 2.54)
+        assert len(positions) == 2001
+        assert positions[-1] == pytest.approx(1.27 + 2.54 * 2000)
+
     def test_zero_interval(self):
         # Zero interval should return just start
         positions = generate_grid_positions(5.08, 10.16, 0.0)
@@ -399,6 +775,43 @@ class TestGenerateTextLabel:
         with pytest.raises(ValueError):
             generate_text_label(3, fmt)
 
+    def test_cache_keyed_on_format_contents(self):
+        # Same index with different custom labels must not share a cached result
+        fmt = TextFormatConfig(type="custom", custom=["a", "b"])
+        assert generate_text_label(1, fmt) == "a"
+        fmt.custom[0] = "z"
+        assert generate_text_label(1, fmt) == "z"
+
+
+class TestGenerateTextLabels:
+    """Tests for generate_text_labels function."""
+
+    @pytest.mark.parametrize(
+        "fmt",
+        [
+            TextFormatConfig(type="number"),
+            TextFormatConfig(type="number", padding=3, start=98),
+            TextFormatConfig(type="letter", start=-1),
+            TextFormatConfig(type="letter_upper", start=25),
+            TextFormatConfig(type="custom", start=0, custom=["a", "_", "b"]),
+        ],
+    )
+    def test_matches_single_label(self, fmt):
+        labels = generate_text_labels(fmt, 5)
+
+        assert len(labels) == 5
+        for i, label in enumerate(labels):
+            index = fmt.start + i
+            if label is None:
+                with pytest.raises(ValueError):
+                    generate_text_label(index, fmt)
+            else:
+                assert label == generate_text_label(index, fmt)
+
+    def test_custom_skip_and_out_of_range(self):
+        fmt = TextFormatConfig(type="custom", custom=["a", "_", "b"])
+        assert generate_text_labels(fmt, 4) == ["a", None, "b", None]
+
 
 class TestCreateTextElement:
     """Tests for create_text_element function."""
@@ -456,6 +869,38 @@ class TestCreateTextElement:
         # y should be exactly at grid Y (baseline at grid Y)
         assert y == pytest.approx(10.0)
 
+    def test_coordinate_precision(self):
+        font = FontConfig(size=10.0)
+        elem, info = create_text_element(
+            1.0, 2.0, "1", font, "text-1", offset=(0.123456, 0.987654)
+        )
+
+        # Attributes are written with 3 decimals (mm), info keeps full precision
+        assert elem.get("x") == "1.123"
+        assert elem.get("y") == "2.988"
+        assert info.text_x == pytest.approx(1.123456)
+
+    @pytest.mark.parametrize(
+        "offset_x, expected",
+        [(0.5, "1.5"), (1.54, "2.54"), (0.0, "1"), (-1.0001, "0"), (-1.25, "-0.25")],
+    )
+    def test_coordinate_trailing_zeros_trimmed(self, offset_x, expected):
+        font = FontConfig(size=10.0)
+        elem, _ = create_text_element(1.0, 2.0, "1", font, "text-1", offset=(offset_x, 0))
+
+        assert elem.get("x") == expected
+
+    def test_precomputed_offset(self):
+        font = FontConfig(size=10.0)
+        elem, info = create_text_element(
+            5.0, 10.0, "1", font, "text-1", offset=(-1.5, 2.0)
+        )
+
+        assert float(elem.get("x")) == pytest.approx(3.5)
+        assert float(elem.get("y")) == pytest.approx(12.0)
+        assert info.text_x == pytest.approx(3.5)
+        assert info.text_y == pytest.approx(12.0)
+
 
 class TestCreateTextGroup:
     """Tests for create_text_group function."""
@@ -586,6 +1031,47 @@ class TestCreateTextGroup:
             expected_y = i * 2.54  # y varies: 0.0, 2.54, 5.08
             assert info.grid_y == pytest.approx(expected_y)
 
+    @pytest.mark.parametrize("vertical", [False, True])
+    def test_matches_create_text_element(self, vertical):
+        """Group elements are identical to individually created elements."""
+        if vertical:
+            rule = TextLineRule(
+                name="g", x=2.54, y_start=0.0, y_end=25.4, y_interval=2.54
+            )
+        else:
+            rule = TextLineRule(
+                name="g", y=2.54, x_start=0.0, x_end=25.4, x_interval=2.54
+            )
+        group, result = create_text_group(rule)
+
+        for elem, info in zip(group, result.elements):
+            expected, expected_info = create_text_element(
+                info.grid_x, info.grid_y, info.text, rule.font, info.element_id
+            )
+            assert elem.attrib == expected.attrib
+            assert elem.text == expected.text
+            assert info == expected_info
+
+    def test_uniform_width_reuses_offset_per_length(self):
+        """Labels of equal length share the offset of the first one measured."""
+        rule = TextLineRule(
+            name="g",
+            y=2.54,
+            x_start=0.0,
+            x_end=30.48,
+            x_interval=2.54,
+            uniform_width=True,
+        )
+        _, result = create_text_group(rule)
+
+        first_offsets: dict[int, tuple[float, float]] = {}
+        for info in result.elements:
+            offset = (info.text_x - info.grid_x, info.text_y - info.grid_y)
+            expected = first_offsets.setdefault(len(info.text), offset)
+            assert offset == pytest.approx(expected, abs=1e-3)
+        # "1".."9" and "10".."13" measured separately
+        assert set(first_offsets) == {1, 2}
+
     def test_vertical_custom_labels_with_skip(self):
         """Test vertical layout with custom labels including skip marker."""
         rule = TextLineRule(
@@ -605,6 +1091,65 @@ class TestCreateTextGroup:
         assert labels == ["a", "b", "c"]
 
 
+class TestBuildTextGroupXml:
+    """Tests for build_text_group_xml function."""
+
+    def _assert_same_tree(self, a: ET.Element, b: ET.Element) -> None:
+        assert a.tag == b.tag
+        assert dict(a.attrib) == dict(b.attrib)
+        assert a.text == b.text
+        assert len(a) == len(b)
+        for child_a, child_b in zip(a, b):
+            self._assert_same_tree(child_a, child_b)
+            assert child_a.tail == child_b.tail
+
+    @pytest.mark.parametrize("vertical", [False, True])
+    def test_matches_create_text_group(self, vertical):
+        if vertical:
+            rule = TextLineRule(
+                name="g", x=2.54, y_start=0.0, y_end=25.4, y_interval=2.54
+            )
+        else:
+            rule = TextLineRule(
+                name="g", y=2.54, x_start=0.0, x_end=25.4, x_interval=2.54
+            )
+        xml, result = build_text_group_xml(rule, "g-text", base_indent=1)
+        group, expected = create_text_group(rule, "g-text", base_indent=1)
+
+        self._assert_same_tree(ET.fromstring(xml), group)
+        assert result == expected
+
+    def test_escapes_labels(self):
+        rule = TextLineRule(
+            name='a&"b',
+            y=2.54,
+            x_start=0.0,
+            x_end=5.08,
+            x_interval=2.54,
+            format=TextFormatConfig(type="custom", custom=["<", "&", '"']),
+        )
+        xml, result = build_text_group_xml(rule)
+        group = ET.fromstring(xml)
+
+        assert group.get("id") == 'a&"b'
+        assert [t.text for t in group] == ["<", "&", '"']
+
+    def test_empty_group(self):
+        rule = TextLineRule(
+            name="g",
+            y=2.54,
+            x_start=0.0,
+            x_end=5.08,
+            x_interval=2.54,
+            format=TextFormatConfig(type="custom", custom=["_"]),
+        )
+        xml, result = build_text_group_xml(rule)
+        group = ET.fromstring(xml)
+
+        assert len(group) == 0
+        assert result.has_errors
+
+
 class TestParseAddTextRuleFile:
     """Tests for parse_add_text_rule_file function."""
 
@@ -926,6 +1471,30 @@ groups:
         assert rule.groups[0].align == "bbox_center"
         assert rule.groups[1].align == "baseline_center"
 
+    def test_parse_uniform_width(self, tmp_path):
+        """Test parsing the optional uniform_width flag."""
+        content = """
+groups:
+  - name: "uniform"
+    y: 2.54
+    x_start: 0.0
+    x_end: 5.08
+    x_interval: 2.54
+    uniform_width: true
+
+  - name: "default"
+    x: 2.54
+    y_start: 0.0
+    y_end: 5.08
+    y_interval: 2.54
+"""
+        rule_file = tmp_path / "uniform.yaml"
+        rule_file.write_text(content)
+        rule = parse_add_text_rule_file(rule_file)
+
+        assert rule.groups[0].uniform_width is True
+        assert rule.groups[1].uniform_width is False
+
     @pytest.fixture
     def default_align_rule_file(self, tmp_path) -> Path:
         """Create a rule file without align field (should use default)."""
@@ -1044,7 +1613,7 @@ class TestAddTextToSvg:
 
         # Write output
         output_file = tmp_path / "output.svg"
-        tree.write(output_file, encoding="unicode", xml_declaration=True)
+        write_svg(tree, output_file)
 
         # Verify output file
         assert output_file.exists()
@@ -1056,6 +1625,116 @@ class TestAddTextToSvg:
         assert len(groups) == 2
 
 
+class TestSpliceTextToSvg:
+    """Tests for splice_text_to_svg function."""
+
+    SVG = """<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg"
+     xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
+     width="100mm" height="100mm">
+  <g inkscape:label="existing">
+    <rect id="rect1" x="0" y="0" width="10" height="10"/>
+  </g>
+</svg>
+"""
+
+    @pytest.fixture
+    def rule(self) -> AddTextRule:
+        return AddTextRule(
+            groups=[
+                TextLineRule(
+                    name="col-labels", y=2.54, x_start=0.0, x_end=5.08, x_interval=2.54
+                ),
+                TextLineRule(
+                    name="broken",
+                    y=5.08,
+                    x_start=0.0,
+                    x_end=0.0,
+                    x_interval=2.54,
+                    format=TextFormatConfig(type="custom", custom=["_"]),
+                ),
+            ]
+        )
+
+    def _write(self, tmp_path, content: str) -> Path:
+        svg_file = tmp_path / "test.svg"
+        svg_file.write_text(content, encoding="utf-8")
+        return svg_file
+
+    def test_keeps_original_bytes(self, tmp_path, rule):
+        svg_file = self._write(tmp_path, self.SVG)
+        data, report = splice_text_to_svg(svg_file, rule)
+
+        head = self.SVG.rpartition("</svg>")[0]
+        assert data.startswith(head.encode())
+        assert data.endswith(b"</svg>\n")
+        assert report.file_path == svg_file
+        assert report.total_elements == 3
+
+    def test_matches_dom_path(self, tmp_path, rule):
+        svg_file = self._write(tmp_path, self.SVG)
+        data, report = splice_text_to_svg(svg_file, rule)
+        tree, expected = add_text_to_svg(svg_file, rule, apply=True)
+
+        spliced = ET.fromstring(data)
+        assert [(e.tag, dict(e.attrib), e.text) for e in spliced.iter()] == [
+            (e.tag, dict(e.attrib), e.text) for e in tree.getroot().iter()
+        ]
+        assert report.group_results == expected.group_results
+
+    def test_root_namespaces_not_redeclared(self, tmp_path, rule):
+        svg_file = self._write(tmp_path, self.SVG)
+        data, _ = splice_text_to_svg(svg_file, rule)
+
+        assert data.count(b'xmlns="http://www.w3.org/2000/svg"') == 1
+
+    def test_declares_namespaces_when_root_lacks_inkscape(self, tmp_path, rule):
+        content = '<svg xmlns="http://www.w3.org/2000/svg"><rect/></svg>'
+        svg_file = self._write(tmp_path, content)
+        data, _ = splice_text_to_svg(svg_file, rule)
+
+        group = ET.fromstring(data)[1]
+        assert group.get(f"{{{SVG_NAMESPACES['inkscape']}}}label") == "col-labels"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '<svg:svg xmlns:svg="http://www.w3.org/2000/svg"></svg:svg>',
+            '<svg xmlns="http://www.w3.org/2000/svg"></svg><!-- trailing -->',
+            '<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+            '<svg xmlns="http://www.w3.org/2000/svg"></svg>',
+            '<svg width="10"></svg>',
+            # Malformed: unclosed <rect>
+            '<svg xmlns="http://www.w3.org/2000/svg"><rect x="1">\n</svg>',
+        ],
+    )
+    def test_unspliceable_documents(self, tmp_path, rule, content):
+        svg_file = self._write(tmp_path, content)
+        assert splice_text_to_svg(svg_file, rule) is None
+
+    def test_malformed_document_falls_back_to_parse_error(self, tmp_path, rule):
+        svg_file = self._write(
+            tmp_path, '<svg xmlns="http://www.w3.org/2000/svg"><rect x="1">\n</svg>'
+        )
+        assert splice_text_to_svg(svg_file, rule) is None
+        with pytest.raises(ET.ParseError):
+            add_text_to_svg(svg_file, rule, apply=True)
+
+    def test_root_found_past_commented_svg(self, tmp_path, rule):
+        # The commented-out tag binds inkscape; the real root does not
+        content = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<!-- <svg xmlns="http://www.w3.org/2000/svg"'
+            ' xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"> -->\n'
+            '<svg xmlns="http://www.w3.org/2000/svg"><rect/></svg>\n'
+        )
+        svg_file = self._write(tmp_path, content)
+        data, _ = splice_text_to_svg(svg_file, rule)
+
+        group = ET.fromstring(data)[1]
+        assert group.get(f"{{{SVG_NAMESPACES['inkscape']}}}label") == "col-labels"
+
+
 class TestFormatAddTextReport:
     """Tests for format_add_text_report function."""
 
@@ -1124,6 +1803,27 @@ class TestFormatAddTextReport:
         assert "Elements: 3" in text
         assert "Total elements: 3" in text
 
+    def test_format_report_summary_only(self):
+        group = GroupAddResult(
+            group_name="labels",
+            fixed_axis="y",
+            fixed_value=2.54,
+            start=0.0,
+            end=2.54,
+            interval=2.54,
+            elements=[
+                TextElementInfo("t1", "1", 0.0, 2.54, -0.1, 2.6),
+                TextElementInfo("t2", "2", 2.54, 2.54, 2.44, 2.6),
+            ],
+        )
+        report = AddTextReport(file_path=Path("test.svg"), group_results=[group])
+
+        text = format_add_text_report(report, summary_only=True)
+
+        assert "Elements: 2" in text
+        assert "Created elements:" not in text
+        assert "t1" not in text
+
     def test_format_report_with_errors(self):
         group = GroupAddResult(
             group_name="labels",
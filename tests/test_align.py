@@ -3,12 +3,11 @@
 import math
 import pytest
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from svg_tools.utils import SVG_NAMESPACES, find_group_by_label
+from svg_tools.utils import ET, SVG_NAMESPACES, find_group_by_label
 from svg_tools.geometry import RectInfo, ArcInfo, PathInfo
 from svg_tools.align import (
     GridRule,
@@ -62,6 +61,13 @@ class TestDataclasses:
         assert config.acceptable == DEFAULT_TOLERANCE
         assert config.error_threshold == DEFAULT_ERROR_THRESHOLD
 
+    def test_issue_is_frozen_and_hashable(self):
+        issue = Issue("rect1", "width", "fixable", 1.5, 1.27, 0.23, "msg")
+        assert not hasattr(issue, "__dict__")
+        assert hash(issue) == hash(Issue("rect1", "width", "fixable", 1.5, 1.27, 0.23, "msg"))
+        with pytest.raises(AttributeError):
+            issue.status = "ok"
+
 
 class TestValidationResult:
     """Tests for ValidationResult dataclass."""
@@ -129,6 +135,26 @@ class TestValidationResult:
         assert result.is_ok is False
         assert result.has_errors is True
 
+    def test_add_issue_updates_counts(self):
+        result = ValidationResult(element_id="test", shape_type="rect")
+        for status in ("fixable", "fixable", "error"):
+            result.add_issue(
+                Issue(
+                    element_id="test",
+                    field="width",
+                    status=status,
+                    actual=1.28,
+                    expected=1.27,
+                    deviation=0.01,
+                    message=status,
+                )
+            )
+        assert len(result.issues) == 3
+        assert result.fixable_count == 2
+        assert result.error_count == 1
+        assert result.has_errors is True
+        assert result.is_ok is False
+
 
 class TestGroupValidationResult:
     """Tests for GroupValidationResult dataclass."""
@@ -166,6 +192,7 @@ class TestGroupValidationResult:
         assert result.error_count == 1
         assert result.fixable_count == 1
         assert result.ok_count == 1
+        assert result.tally() == (1, 1, 1)
 
 
 class TestAlignmentReport:
@@ -200,6 +227,34 @@ class TestAlignmentReport:
         )
         assert report.total_elements == 3
 
+    def test_add_group_updates_totals(self):
+        error_issue = Issue(
+            element_id="e2",
+            field="width",
+            status="error",
+            actual=2.0,
+            expected=1.27,
+            deviation=0.73,
+            message="error",
+        )
+        group = GroupValidationResult(
+            group_name="g1",
+            shape_type="rect",
+            element_results=[
+                ValidationResult(element_id="e1", shape_type="rect"),
+                ValidationResult(
+                    element_id="e2", shape_type="rect", issues=[error_issue]
+                ),
+            ],
+        )
+        report = AlignmentReport(file_path=Path("test.svg"))
+        report.add_group(group)
+        assert report.group_results == [group]
+        assert report.total_elements == 2
+        assert report.total_errors == 1
+        assert report.total_fixable == 0
+        assert report.has_errors is True
+
 
 class TestParseRuleFile:
     """Tests for parse_rule_file function."""
@@ -393,6 +448,41 @@ class TestIterShapesInGroup:
         assert isinstance(shapes[0], ArcInfo)
         assert shapes[0].id == "arc1"
 
+    def test_iter_nested_rects(self):
+        svg_ns = SVG_NAMESPACES["svg"]
+        group = ET.Element(f"{{{svg_ns}}}g")
+        inner = ET.SubElement(group, f"{{{svg_ns}}}g")
+        ET.SubElement(
+            inner,
+            f"{{{svg_ns}}}rect",
+            {"id": "nested", "x": "0", "y": "0", "width": "10", "height": "10"},
+        )
+
+        shapes = list(iter_shapes_in_group(group, "rect"))
+        assert [s.id for s in shapes] == ["nested"]
+
+    def test_iter_unnamespaced_shapes(self):
+        sodipodi_ns = SVG_NAMESPACES["sodipodi"]
+        group = ET.Element("g")
+        ET.SubElement(
+            group,
+            "rect",
+            {"id": "rect1", "x": "0", "y": "0", "width": "10", "height": "10"},
+        )
+        ET.SubElement(group, "path", {"id": "arc1", f"{{{sodipodi_ns}}}type": "arc"})
+        ET.SubElement(group, "path", {"id": "path1", "d": "M0,0 L10,10"})
+
+        assert [s.id for s in iter_shapes_in_group(group, "rect")] == ["rect1"]
+        assert [s.id for s in iter_shapes_in_group(group, "arc")] == ["arc1"]
+        assert [s.id for s in iter_shapes_in_group(group, "path")] == ["path1"]
+
+    def test_unknown_shape_type_yields_nothing(self):
+        svg_ns = SVG_NAMESPACES["svg"]
+        group = ET.Element(f"{{{svg_ns}}}g")
+        ET.SubElement(group, f"{{{svg_ns}}}circle")
+
+        assert list(iter_shapes_in_group(group, "circle")) == []
+
 
 class TestValidateRect:
     """Tests for validate_rect function."""
@@ -905,3 +995,33 @@ class TestFormatReport:
 
         assert "FIXABLE" in text
         assert "All fixable issues can be corrected" in text
+
+    def test_format_report_summary_only(self):
+        group = GroupValidationResult(
+            group_name="test",
+            shape_type="rect",
+            element_results=[
+                ValidationResult(
+                    element_id="rect1",
+                    shape_type="rect",
+                    issues=[
+                        Issue("rect1", "width", "fixable", 1.28, 1.27, 0.01, "width=1.28")
+                    ],
+                ),
+                ValidationResult(
+                    element_id="rect2",
+                    shape_type="rect",
+                    issues=[
+                        Issue("rect2", "width", "error", 5.0, 1.27, 3.73, "width=5.0")
+                    ],
+                ),
+            ],
+        )
+        report = AlignmentReport(file_path=Path("test.svg"), group_results=[group])
+
+        text = format_report(report, summary_only=True)
+
+        # Fixable elements are omitted, errors are still listed
+        assert "rect1" not in text
+        assert "[ERROR] rect2" in text
+        assert "Fixable: 1" in text
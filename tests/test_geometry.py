@@ -2,12 +2,11 @@
 
 import pytest
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from svg_tools.utils import SVG_NAMESPACES
+from svg_tools.utils import ET, SVG_NAMESPACES
 from svg_tools.geometry import (
     BoundingBox,
     RectInfo,
@@ -63,6 +62,17 @@ class TestRectInfo:
         info = RectInfo(element=elem, id="test", x=0, y=0, width=10, height=20)
         assert info.center == (5, 10)
 
+    def test_is_slotted(self):
+        elem = ET.Element("rect")
+        info = RectInfo(element=elem, id="test", x=0, y=0, width=10, height=20)
+        assert not hasattr(info, "__dict__")
+        assert not hasattr(info.bbox, "__dict__")
+
+    def test_center_matches_bbox_center(self):
+        elem = ET.Element("rect")
+        info = RectInfo(element=elem, id="test", x=1.1, y=2.3, width=0.7, height=1.9)
+        assert info.center == info.bbox.center
+
 
 class TestArcInfo:
     """Tests for ArcInfo dataclass."""
@@ -441,6 +451,18 @@ class TestPathInfo:
         )
         assert info.center == (5.0, 10.0)
 
+    def test_center_matches_bbox_center(self):
+        elem = ET.Element("path")
+        info = PathInfo(
+            element=elem,
+            id="path-001",
+            start_x=7.62,
+            start_y=12.7,
+            end_x=2.54,
+            end_y=5.08,
+        )
+        assert info.center == info.bbox.center
+
     def test_is_vertical(self):
         elem = ET.Element("path")
         info = PathInfo(
@@ -584,3 +606,9 @@ class TestUpdatePath:
         d = elem.get("d")
         assert "5.08" in d
         assert "17.78" in d
+
+    def test_update_all_points_skips_parse(self):
+        # Current d is unparseable; all four values make parsing unnecessary
+        elem = ET.Element("path", {"id": "path-004", "d": ""})
+        update_path(elem, start_x=0.0, start_y=0.0, end_x=10.0, end_y=0.0)
+        assert elem.get("d") == "M 0.0,0.0 H 10.0"
@@ -2,7 +2,6 @@
 
 import pytest
 from pathlib import Path
-from xml.etree import ElementTree as ET
 import tempfile
 import sys
 
@@ -23,7 +22,7 @@ from svg_tools.process import (
 from svg_tools.align import AlignmentRule, ToleranceConfig
 from svg_tools.relabel import RelabelRule
 from svg_tools.add_text import AddTextRule
-from svg_tools.utils import register_namespaces
+from svg_tools.utils import ET, register_namespaces
 
 
 class TestProcessRule:
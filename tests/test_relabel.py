@@ -2,12 +2,17 @@
 
 import pytest
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from svg_tools.utils import SVG_NAMESPACES, get_element_label, set_element_label
+from svg_tools.utils import (
+    ET,
+    SVG_NAMESPACES,
+    get_element_label,
+    set_element_label,
+    write_svg,
+)
 from svg_tools.relabel import (
     GridConfig,
     OriginConfig,
@@ -988,7 +993,7 @@ class TestRelabelSvg:
 
         # Write output
         output_file = tmp_path / "output.svg"
-        tree.write(output_file, encoding="unicode", xml_declaration=True)
+        write_svg(tree, output_file)
 
         # Verify output file
         assert output_file.exists()
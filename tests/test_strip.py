@@ -2,12 +2,11 @@
 
 import pytest
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from svg_tools.utils import SVG_NAMESPACES
+from svg_tools.utils import ET, SVG_NAMESPACES
 from svg_tools.strip import (
     StripRule,
     StripGroupResult,
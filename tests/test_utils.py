@@ -1,13 +1,14 @@
 """Tests for svg_tools.utils module."""
 
 import pytest
+import yaml
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from svg_tools.utils import (
+    ET,
     SVG_NAMESPACES,
     DRAWING_ELEMENTS,
     get_local_name,
@@ -19,10 +20,23 @@ from svg_tools.utils import (
     analyze_svg,
     iter_all_groups,
     parse_svg,
+    load_yaml,
     find_all_groups_by_label,
+    find_group_by_label,
+    index_groups_by_label,
+    iter_by_local_name,
+    load_svg,
 )
 
 
+class TestSvgNamespaces:
+    """Tests for the SVG_NAMESPACES mapping."""
+
+    def test_is_read_only(self):
+        with pytest.raises(TypeError):
+            SVG_NAMESPACES["svg"] = "http://example.com"
+
+
 class TestGetLocalName:
     """Tests for get_local_name function."""
 
@@ -297,6 +311,20 @@ class TestIterAllGroups:
         names = [g.name for g in iter_all_groups(stats)]
         assert names == ["layer1", "layer2"]
 
+    def test_deep_nesting(self):
+        # Deeper than the default recursion limit
+        root = GroupStats(name="g0", depth=0)
+        current = root
+        for i in range(1, 5000):
+            child = GroupStats(name=f"g{i}", depth=i)
+            current.children.append(child)
+            current = child
+        stats = SVGStats(file_path=Path("test.svg"), root_groups=[root])
+
+        groups = list(iter_all_groups(stats))
+        assert len(groups) == 5000
+        assert groups[-1].name == "g4999"
+
 
 class TestFindAllGroupsByLabel:
     """Tests for find_all_groups_by_label function."""
@@ -359,6 +387,71 @@ class TestFindAllGroupsByLabel:
         assert labels == ["s-circle 2", "s-circle", "s-circle 1"]
 
 
+class TestUnnamespacedGroups:
+    """Group lookups match <g> by local name, with or without a namespace."""
+
+    def _make_root(self) -> ET.Element:
+        inkscape_ns = SVG_NAMESPACES["inkscape"]
+        root = ET.Element("svg")
+        ET.SubElement(root, "g", {f"{{{inkscape_ns}}}label": "s-circle"})
+        ET.SubElement(
+            root,
+            f"{{{SVG_NAMESPACES['svg']}}}g",
+            {f"{{{inkscape_ns}}}label": "s-circle 1"},
+        )
+        return root
+
+    def test_find_group_by_label(self):
+        root = self._make_root()
+        assert find_group_by_label(root, "s-circle") is root[0]
+
+    def test_find_all_groups_by_label(self):
+        root = self._make_root()
+        assert find_all_groups_by_label(root, "s-circle") == [root[0], root[1]]
+
+    def test_index_groups_by_label(self):
+        root = self._make_root()
+        assert index_groups_by_label(root)["s-circle"] == [root[0], root[1]]
+
+
+class TestIterByLocalName:
+    """Tests for iter_by_local_name function."""
+
+    def test_matches_any_namespace(self):
+        root = ET.Element("svg")
+        plain = ET.SubElement(root, "g")
+        svg_g = ET.SubElement(root, f"{{{SVG_NAMESPACES['svg']}}}g")
+        other = ET.SubElement(svg_g, "{urn:other}g")
+        ET.SubElement(root, "gg")
+        ET.SubElement(root, f"{{{SVG_NAMESPACES['svg']}}}rect")
+
+        assert list(iter_by_local_name(root, "g")) == [plain, svg_g, other]
+
+    def test_includes_root(self):
+        root = ET.Element(f"{{{SVG_NAMESPACES['svg']}}}g")
+        assert list(iter_by_local_name(root, "g")) == [root]
+
+
+class TestIndexGroupsByLabel:
+    """Tests for index_groups_by_label function."""
+
+    LABELS = (
+        "s-circle 2", "s-circle", "s-circle-extra", "s-circle1",
+        "Layer 1", "s-circle 1", "a 1 2", "",
+    )
+
+    def test_matches_find_all_groups_by_label(self):
+        root = TestFindAllGroupsByLabel()._make_root(*self.LABELS)
+        index = index_groups_by_label(root)
+
+        for label in ("s-circle", "s-circle-extra", "Layer", "Layer 1", "a 1", "a", "x"):
+            assert index.get(label, []) == find_all_groups_by_label(root, label)
+
+    def test_unlabelled_groups_skipped(self):
+        root = TestFindAllGroupsByLabel()._make_root("")
+        assert index_groups_by_label(root) == {}
+
+
 class TestAnalyzeSvg:
     """Tests for analyze_svg function with actual SVG file."""
 
@@ -417,6 +510,13 @@ class TestAnalyzeSvg:
         assert layer2.name == "layer2"
         assert layer2.element_counts == {"text": 1}
 
+    def test_counts_sorted_by_type(self, sample_svg):
+        stats = analyze_svg(sample_svg)
+
+        # Scan order is rect, path; counts are stored sorted by element type
+        layer1 = stats.root_groups[0]
+        assert list(layer1.element_counts) == ["path", "rect"]
+
     def test_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             analyze_svg(Path("/nonexistent/file.svg"))
@@ -446,3 +546,50 @@ class TestParseSvg:
 
         with pytest.raises(ET.ParseError):
             parse_svg(invalid_file)
+
+
+class TestLoadSvg:
+    """Tests for load_svg function."""
+
+    def test_attribute_over_10mb(self, tmp_path):
+        # Inkscape embeds raster images as base64 data URIs
+        data = "A" * (11 * 1024 * 1024)
+        svg_file = tmp_path / "embedded.svg"
+        svg_file.write_text(
+            '<svg xmlns="http://www.w3.org/2000/svg"'
+            ' xmlns:xlink="http://www.w3.org/1999/xlink">'
+            f'<image xlink:href="data:image/png;base64,{data}"/></svg>'
+        )
+
+        tree = load_svg(svg_file)
+        image = tree.getroot()[0]
+        href = image.get(f"{{{SVG_NAMESPACES['xlink']}}}href")
+        assert len(href) == len("data:image/png;base64,") + len(data)
+
+
+class TestLoadYaml:
+    """Tests for load_yaml function."""
+
+    def test_load_dict(self, tmp_path):
+        yaml_file = tmp_path / "rule.yaml"
+        yaml_file.write_text("groups:\n  - name: a\n    grid: { x: 1.27 }\n")
+
+        data = load_yaml(yaml_file)
+        assert data == {"groups": [{"name": "a", "grid": {"x": 1.27}}]}
+
+    def test_load_utf8_with_bom(self, tmp_path):
+        yaml_file = tmp_path / "rule.yaml"
+        yaml_file.write_bytes("\ufefflabels: [α, β]\n".encode("utf-8"))
+
+        assert load_yaml(yaml_file) == {"labels": ["α", "β"]}
+
+    def test_file_not_found(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_yaml(tmp_path / "missing.yaml")
+
+    def test_invalid_yaml(self, tmp_path):
+        yaml_file = tmp_path / "invalid.yaml"
+        yaml_file.write_text("groups: [unclosed\n")
+
+        with pytest.raises(yaml.YAMLError):
+            load_yaml(yaml_file)